@@ -4,17 +4,46 @@ supports uploading resumes, cross-resume queries, and conversation memory
 built with streamlit, faiss, and openai
 """
 
+import os
+
+# the encoder (torch) and faiss get disjoint halves of the cores so a search running next to
+# an encode (another session, or the background retrieval thread) doesnt oversubscribe the cpu
+# OMP_NUM_THREADS is the default for every thread, so it carries the torch budget; openmp
+# thread counts are per thread, so faiss searches apply FAISS_NUM_THREADS on their own thread
+# (embedding_utils.use_faiss_threads)
+CPU_COUNT = os.cpu_count() or 1
+TORCH_THREADS = max(1, CPU_COUNT // 2)
+FAISS_THREADS = max(1, CPU_COUNT - TORCH_THREADS)
+os.environ.setdefault("OMP_NUM_THREADS", str(TORCH_THREADS))
+os.environ.setdefault("MKL_NUM_THREADS", str(TORCH_THREADS))
+os.environ.setdefault("FAISS_NUM_THREADS", str(FAISS_THREADS))
+
+import html
 import json
+import mmap
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import streamlit as st
 import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from openai import OpenAI
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from dotenv import load_dotenv
-import os
 from resume_manager import ResumeManager
+from resume_processor import OPENAI_MAX_RETRIES
 from tools import init_resources, get_openai_tools, run_tool
+from embedding_utils import encode_many, encode_queries, load_encoder, normalize_query
+
+# orjson parses and serializes several times faster than the stdlib json module
+# its JSONDecodeError subclasses json.JSONDecodeError so the except clauses below cover both
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # load environment variables from the env file
 load_dotenv()
@@ -41,2129 +70,804 @@ if not api_key:
     st.stop()
 
 # create the openai client for making api calls
-client = OpenAI(api_key=api_key)
+# the sdk retries rate limits and 5xx errors with exponential backoff
+client = OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
 
 
 @st.cache_resource
-def load_resources():
+def configure_threads():
     """
-    loads the sentence transformer model and faiss index for semantic search
-    also loads and chunks the personal data files for retrieval
-    cached so it only runs once per session
+    sizes torch's inter-op pool, the one thread setting that is process-wide
+    torch refuses to change interop threads after parallel work starts,
+    so this must not run again on every streamlit rerun
+    the intra-op (openmp) thread count is per thread and is not set here - calling
+    torch.set_num_threads would only size whichever script thread ran first, so the
+    OMP_NUM_THREADS / MKL_NUM_THREADS env vars above are what size it for every thread
+    """
+    try:
+        import torch
+        torch.set_num_interop_threads(2)
+    except (ImportError, RuntimeError):
+        pass  # onnx-only installs or torch already started its pools
+
+
+configure_threads()
+
+
+@st.cache_resource
+def get_encoder():
+    """
+    loads the text encoder once per process (int8 onnx when exported, else sentence transformer)
+    shared by personal chat and the resume manager
+    """
+    model = load_encoder()
+    # one throwaway encode so tokenizer setup and the first forward pass
+    # (onnx graph optimization / cuda kernel selection) happen at load time, not on the first question
+    encode_many(model, ["warmup"])
+    return model
+
+
+# blank line between paragraphs, matched on the raw bytes (tolerates windows line endings)
+PARAGRAPH_BREAK_RE = re.compile(rb"\r?\n\r?\n")
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_chunks(resume_mtime: float, personal_mtime: float) -> list:
+    """
+    reads and splits the personal data files into retrieval chunks
+    persisted to disk so warm restarts skip the file reads and splitting
+    the file modification times are part of the cache key so edits are picked up
     """
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    index = faiss.read_index("faiss_index.bin")
-    
-    # load the text files containing personal info
-    with open("resume.txt", "r") as f:
-        resume_data = f.read()
-    with open("personal.txt", "r") as f:
-        personal_data = f.read()
-    
     # split resume into chunks by paragraph for better retrieval
-    resume_chunks = [chunk.strip() for chunk in resume_data.split("\n\n") if chunk.strip()]
-    chunks = resume_chunks + [personal_data]
-    
-    return model, index, chunks
+    # the file is memory-mapped and split as bytes so only the kept chunks get decoded into strings
+    resume_chunks = []
+    if os.path.getsize("resume.txt") > 0:  # mmap cant map an empty file
+        with open("resume.txt", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw_chunk in PARAGRAPH_BREAK_RE.split(mm):
+                chunk = raw_chunk.decode("utf-8").strip()
+                if chunk:
+                    resume_chunks.append(chunk)
+    
+    # personal data stays one chunk since its usually shorter
+    with open("personal.txt", "r", encoding="utf-8") as f:
+        personal_data = f.read()
+    return resume_chunks + [personal_data]
 
 
-def get_resume_manager():
+@st.cache_data(show_spinner=False)
+def get_roxy_blurb() -> str:
     """
-    gets or creates the resume manager from session state
-    keeps the manager persistent across reruns
+    reads the first 500 characters of resume.txt for the About Roxy card once per process
+    returns the html-escaped blurb (with an ellipsis when cut) or an empty string if the file is missing
     """
-    if 'resume_manager' not in st.session_state:
-        st.session_state.resume_manager = ResumeManager()
-    return st.session_state.resume_manager
+    try:
+        with open("resume.txt", "r") as f:
+            roxy_blurb = f.read().strip()[:500]
+    except FileNotFoundError:
+        return ""
+    if not roxy_blurb:
+        return ""
+    return html.escape(roxy_blurb + ("…" if len(roxy_blurb) >= 500 else ""))
 
 
-def init_conversation_context():
+# precomputed float16 chunk embeddings written by embeddata.py
+CHUNK_EMBEDDINGS_PATH = "chunk_embeddings.npy"
+
+
+@st.cache_resource
+def get_index():
     """
-    initializes conversation context tracking for better multi-turn awareness
-    tracks which candidates have been mentioned and the conversation flow
+    loads the faiss index for personal semantic search once per process
     """
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
-    
-    if 'conversation_context' not in st.session_state:
-        st.session_state.conversation_context = {
-            'last_candidate': None,
-            'last_query_type': None,
-            'mentioned_candidates': set()
-        }
+    # memory-map the file read-only so startup doesnt copy the whole index into ram
+    # and the os can share the pages across worker restarts
+    index = faiss.read_index("faiss_index.bin", faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    # ivf indexes only scan nprobe cells per query; flat indexes have no nprobe
+    # extract_index_ivf also reaches through the opq pre-transform
+    try:
+        faiss.extract_index_ivf(index).nprobe = 8
+    except RuntimeError:
+        pass
+    
+    # copy the index onto the gpu when faiss-gpu and a cuda device are available
+    # the file on disk stays a cpu index; nprobe is set above so the clone inherits it
+    if hasattr(faiss, "StandardGpuResources") and faiss.get_num_gpus() > 0:
+        try:
+            index = faiss.index_cpu_to_gpu(get_gpu_resources(), 0, index)
+        except RuntimeError:
+            pass  # index type without a gpu implementation (e.g. flat sq8) stays on the cpu
+    
+    # one throwaway search pages the memory-mapped index in before the first real query
+    index.search(np.zeros((1, index.d), dtype=np.float32), 1)
+    return index
 
 
-def update_conversation_context(query: str, resume_manager):
+@st.cache_resource
+def get_gpu_resources():
     """
-    updates conversation context based on the query and available candidates
-    helps the LLM understand who is being discussed in follow-up questions
+    creates the faiss gpu resources once - they have to outlive any index cloned onto the gpu
     """
-    context = st.session_state.conversation_context
-    
-    # extract candidate names mentioned in the query
-    if hasattr(resume_manager, 'resumes'):
-        for candidate_id, resume_data in resume_manager.resumes.items():
-            candidate_name = resume_data['metadata']['candidate_name']
-            # check if name or parts of name are mentioned
-            name_parts = candidate_name.lower().split()
-            query_lower = query.lower()
-            if candidate_name.lower() in query_lower or any(part in query_lower for part in name_parts if len(part) > 2):
-                context['mentioned_candidates'].add(candidate_name)
-                context['last_candidate'] = candidate_name
-    
-    # detect query type for better context handling
-    query_lower = query.lower()
-    if any(word in query_lower for word in ['compare', 'versus', 'vs', 'both', 'difference', 'between']):
-        context['last_query_type'] = 'comparison'
-    elif any(word in query_lower for word in ['who', 'which candidate', 'find', 'anyone', 'best', 'most']):
-        context['last_query_type'] = 'search'
-    elif any(word in query_lower for word in ['tell me more', 'what about', 'their', 'them', 'summarize', 'elaborate']):
-        context['last_query_type'] = 'follow_up'
-    else:
-        context['last_query_type'] = 'general'
+    return faiss.StandardGpuResources()
 
 
-def get_all_candidates_summary(resume_manager) -> str:
+@st.cache_resource
+def get_chunks():
     """
-    creates a concise summary of all uploaded candidates for context
-    helps the LLM keep track of who is in the database
+    loads the chunked personal data and the embeddings used to rerank index hits
+    returns tuple of (chunks, chunk_embeddings)
     """
-    if not hasattr(resume_manager, 'resumes') or not resume_manager.resumes:
-        return "No candidates uploaded yet."
-    
-    summaries = []
-    for candidate_id, resume_data in resume_manager.resumes.items():
-        meta = resume_data['metadata']
-        skills = meta.get('key_skills', [])[:4]
-        skills_str = ', '.join(skills) if skills else 'Not specified'
-        summary = (
-            f"• {meta['candidate_name']}: "
-            f"{meta.get('current_role', 'Unknown role')} | "
-            f"{meta.get('experience_years', 'Unknown')} years exp | "
-            f"Skills: {skills_str}"
-        )
-        summaries.append(summary)
-    
-    return '\n'.join(summaries) if summaries else "No candidates uploaded yet."
+    # object array so a whole set of hits can be gathered with one np.take
+    chunk_list = load_chunks(os.path.getmtime("resume.txt"), os.path.getmtime("personal.txt"))
+    chunks = np.array(chunk_list, dtype=object)
+    
+    # chunk embeddings (one contiguous matrix) used to rerank index candidates
+    # stored as float16 to halve memory and bandwidth - candidates are upcast per query
+    # embeddata.py saves them next to the index; memory-map that file when it is newer than
+    # the data files and matches the chunk count, otherwise encode once and save it
+    source_mtime = max(os.path.getmtime("resume.txt"), os.path.getmtime("personal.txt"))
+    if os.path.exists(CHUNK_EMBEDDINGS_PATH) and os.path.getmtime(CHUNK_EMBEDDINGS_PATH) >= source_mtime:
+        chunk_embeddings = np.load(CHUNK_EMBEDDINGS_PATH, mmap_mode="r")
+        if len(chunk_embeddings) == len(chunk_list):
+            return chunks, chunk_embeddings
+    chunk_embeddings = encode_many(get_encoder(), chunk_list).astype(np.float16)
+    try:
+        np.save(CHUNK_EMBEDDINGS_PATH, chunk_embeddings)
+    except OSError:
+        pass  # read-only deploys just keep the in-memory copy
+    return chunks, chunk_embeddings
 
 
-def build_context_aware_system_prompt(resume_manager, retrieved_docs: str = "") -> str:
+def load_resources():
     """
-    builds a system prompt that includes conversation context for better multi-turn awareness
-    helps the LLM understand pronouns and follow-up references correctly
+    gathers the model, faiss index, chunks, and chunk embeddings for semantic search
+    each piece is cached separately, so this only loads what hasnt been loaded yet
     """
-    context = st.session_state.conversation_context
-    candidates_summary = get_all_candidates_summary(resume_manager)
-    
-    last_candidate = context.get('last_candidate') or 'None yet'
-    mentioned = ', '.join(context.get('mentioned_candidates', set())) or 'None yet'
-    query_type = context.get('last_query_type') or 'initial query'
-    
-    system_prompt = f"""You are an expert HR assistant analyzing resumes for hiring decisions.
+    chunks, chunk_embeddings = get_chunks()
+    return get_encoder(), get_index(), chunks, chunk_embeddings
 
-=== CANDIDATES IN DATABASE ===
-{candidates_summary}
 
-=== CONVERSATION CONTEXT ===
-- Last discussed candidate: {last_candidate}
-- Previously mentioned candidates: {mentioned}
-- Current query type: {query_type}
+@st.cache_data(max_entries=512, show_spinner=False)
+def _embed_normalized_query(text: str) -> np.ndarray:
+    """
+    encodes an already normalized query - memoized so repeats skip the transformer forward pass
+    """
+    return encode_queries(get_encoder(), [text])
 
-=== CRITICAL INSTRUCTIONS FOR CONTEXT AWARENESS ===
-0. When Roxy is among the candidates, prioritize or highlight her when relevant; other candidates are secondary. Focus comparisons on Roxy when the recruiter asks about "me" or the primary candidate.
-1. When the user says "tell me more", "what about them", "their background", or uses pronouns like "he/she/they", they are referring to: {last_candidate}
-2. When comparing candidates, ALWAYS state each candidate's FULL NAME before discussing their details
-3. In EVERY sentence about a candidate, specify WHICH candidate you're discussing by name
-4. If the user's question is ambiguous about which candidate, ask for clarification: "Are you asking about [Candidate A] or [Candidate B]?"
-5. When a candidate is first mentioned in a response, include their role: "John Smith (Senior Software Engineer)"
-6. Track pronouns carefully - if you use "he/she/they", make sure it's clear who you mean
 
-=== RETRIEVED RESUME INFORMATION ===
-{retrieved_docs}
+def embed_query(text: str) -> np.ndarray:
+    """
+    encodes a search query with the cached sentence transformer
+    the cache key is lowercased with whitespace collapsed - MiniLM is uncased and the tokenizer
+    ignores extra spaces, so "Tell me more " and "tell me more" share one embedding
+    normalized to unit length to match the inner-product index
+    """
+    return _embed_normalized_query(normalize_query(text))
 
-Answer the user's question using the information above. Be specific, professional, and ALWAYS clarify who you're talking about."""
 
-    return system_prompt
+# finished personal chat answers are reused for an hour, up to 128 conversations
+PERSONAL_CACHE_TTL = 3600
+PERSONAL_CACHE_MAX_ENTRIES = 128
 
+# per-session bounds on personal chat history - an even message cap keeps whole user/assistant turns
+PERSONAL_CHAT_MAX_MESSAGES = 200
+PERSONAL_MAX_CHATS = 50
 
-# custom css for dark theme with cyan/purple gradient accents
-# inspired by modern dashboard design with glass morphism
-st.markdown("""
-<style>
-    /* import clean font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Plus+Jakarta+Sans:wght@400;500;600;700;800&family=Playfair+Display:wght@500;600;700&display=swap');
-    
-    /* css variables for consistent theming */
-    :root {
-        --bg-primary: #0a0f1a;
-        --bg-secondary: #111827;
-        --bg-card: #1a2332;
-        --bg-card-hover: #1f2a3d;
-        --accent-cyan: #22d3ee;
-        --accent-teal: #2dd4bf;
-        --accent-purple: #a855f7;
-        --accent-magenta: #ec4899;
-        --accent-blue: #3b82f6;
-        --text-primary: #f1f5f9;
-        --text-secondary: #94a3b8;
-        --text-muted: #64748b;
-        --border-subtle: rgba(255, 255, 255, 0.1);
-        --border-accent: rgba(34, 211, 238, 0.4);
-        --gradient-primary: linear-gradient(135deg, #22d3ee 0%, #a855f7 100%);
-        --gradient-secondary: linear-gradient(135deg, #a855f7 0%, #ec4899 100%);
-        --gradient-button: linear-gradient(135deg, #06b6d4 0%, #8b5cf6 100%);
-        --shadow-glow-cyan: 0 0 40px rgba(34, 211, 238, 0.3);
-        --shadow-glow-purple: 0 0 40px rgba(168, 85, 247, 0.3);
-        --shadow-glow-mixed: 0 0 50px rgba(34, 211, 238, 0.2), 0 0 80px rgba(168, 85, 247, 0.15);
-    }
-    
-    /* main app background - deep dark blue with subtle gradient */
-    .stApp {
-        background: linear-gradient(180deg, #0a0f1a 0%, #0d1321 50%, #111827 100%);
-        font-family: 'Inter', sans-serif;
-        min-height: 100vh;
-    }
-    
-    /* main content container */
-    .main .block-container {
-        background: transparent;
-        padding: 2rem 3rem;
-        max-width: 100%;
-    }
-    
-    /* sidebar styling - dark with accent glow - ensure visibility */
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0d1321 0%, #111827 100%) !important;
-        border-right: 1px solid var(--border-subtle) !important;
-        box-shadow: 4px 0 30px rgba(0, 0, 0, 0.3) !important;
-        display: flex !important;
-        visibility: visible !important;
-    }
-    
-    [data-testid="stSidebar"] > div:first-child {
-        background: transparent !important;
-        padding: 1.5rem 1rem !important;
-    }
-    
-    /* Ensure sidebar content is visible */
-    [data-testid="stSidebarContent"] {
-        display: block !important;
-        visibility: visible !important;
-    }
-    
-    /* PAGE TITLES - Large and prominent - using !important everywhere to override Streamlit */
-    .page-title {
-        font-size: 3rem !important;
-        font-weight: 800 !important;
-        background: linear-gradient(135deg, #22d3ee 0%, #a855f7 100%) !important;
-        -webkit-background-clip: text !important;
-        -webkit-text-fill-color: transparent !important;
-        background-clip: text !important;
-        margin: 0 0 0.5rem 0 !important;
-        padding: 0 !important;
-        letter-spacing: -0.03em !important;
-        line-height: 1.1 !important;
-        display: block !important;
-        border: none !important;
-    }
-    
-    .page-subtitle {
-        color: #94a3b8 !important;
-        font-size: 1.2rem !important;
-        font-weight: 400 !important;
-        margin: 0 0 2rem 0 !important;
-        padding: 0 !important;
-    }
-    
-    /* Section headers */
-    .section-header {
-        font-size: 1.4rem !important;
-        font-weight: 700 !important;
-        color: var(--text-primary) !important;
-        margin-bottom: 1rem !important;
-        padding-bottom: 0.75rem;
-        border-bottom: 2px solid var(--border-subtle);
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-    }
-    
-    .section-header-icon {
-        display: inline-block;
-        width: 8px;
-        height: 8px;
-        background: var(--gradient-primary);
-        border-radius: 50%;
-        box-shadow: 0 0 10px var(--accent-cyan);
-    }
-    
-    /* all headings - light text with gradient option */
-    h1, h2, h3, h4, h5, h6 {
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
-        letter-spacing: -0.02em;
-    }
-    
-    h1 {
-        font-size: 2.5rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    h2 {
-        font-size: 1.75rem !important;
-        color: var(--text-primary) !important;
-    }
-    
-    h3 {
-        font-size: 1.35rem !important;
-        color: var(--text-primary) !important;
-    }
-    
-    h4 {
-        font-size: 1.1rem !important;
-        color: var(--accent-cyan) !important;
-    }
-    
-    /* paragraph and general text */
-    p, span, li {
-        color: var(--text-secondary);
-        font-size: 0.95rem;
-        line-height: 1.7;
-    }
-    
-    /* labels and form text */
-    label, .stTextInput label, .stSelectbox label, .stFileUploader label {
-        color: var(--text-secondary) !important;
-        font-weight: 500 !important;
-        font-size: 0.9rem !important;
-    }
-    
-    /* input fields - dark glass style with glow */
-    .stTextInput > div > div {
-        background: transparent !important;
-        padding: 0 !important;
-    }
-    
-    .stTextInput > div > div > input {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-subtle) !important;
-        border-radius: 14px !important;
-        color: var(--text-primary) !important;
-        padding: 16px 20px !important;
-        font-size: 1rem !important;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: var(--accent-cyan) !important;
-        box-shadow: 0 0 0 3px rgba(34, 211, 238, 0.15), var(--shadow-glow-cyan) !important;
-    }
-    
-    .stTextInput > div > div > input::placeholder {
-        color: var(--text-muted) !important;
-    }
-    
-    /* buttons - gradient style with glow - ENSURE WHITE TEXT */
-    .stButton > button {
-        background: var(--gradient-button) !important;
-        color: #ffffff !important;
-        border: none !important;
-        border-radius: 12px !important;
-        padding: 0.8rem 2rem !important;
-        font-weight: 700 !important;
-        font-size: 1rem !important;
-        transition: all 0.3s ease !important;
-        box-shadow: 0 4px 20px rgba(34, 211, 238, 0.3) !important;
-        text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3) !important;
-    }
-    
-    /* Force all text inside buttons to be white */
-    .stButton > button * {
-        color: #ffffff !important;
-    }
-    
-    .stButton > button p,
-    .stButton > button span,
-    .stButton > button div {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-3px) !important;
-        box-shadow: var(--shadow-glow-mixed) !important;
-    }
-    
-    /* secondary/outline buttons */
-    .stButton > button[kind="secondary"] {
-        background: transparent !important;
-        color: var(--accent-cyan) !important;
-        border: 2px solid var(--accent-cyan) !important;
-        box-shadow: none !important;
-        text-shadow: none !important;
-    }
-    
-    .stButton > button[kind="secondary"] * {
-        color: var(--accent-cyan) !important;
-    }
-    
-    .stButton > button[kind="secondary"]:hover {
-        background: rgba(34, 211, 238, 0.15) !important;
-        box-shadow: var(--shadow-glow-cyan) !important;
-    }
-    
-    /* file uploader - responsive and properly contained */
-    .stFileUploader {
-        background: var(--bg-card) !important;
-        border-radius: 16px !important;
-        padding: 1.25rem !important;
-        border: 2px dashed rgba(34, 211, 238, 0.4) !important;
-        transition: all 0.3s ease !important;
-        min-width: 0 !important;
-        overflow: hidden !important;
-    }
-    
-    .stFileUploader:hover {
-        border-color: var(--accent-cyan) !important;
-        box-shadow: var(--shadow-glow-cyan) !important;
-    }
-    
-    .stFileUploader label {
-        color: var(--text-secondary) !important;
-    }
-    
-    /* File uploader inner content - prevent text overflow */
-    [data-testid="stFileUploader"] {
-        min-width: 0 !important;
-    }
-    
-    [data-testid="stFileUploader"] section {
-        background: transparent !important;
-        border: none !important;
-        min-width: 0 !important;
-    }
-    
-    [data-testid="stFileUploader"] section > div {
-        min-width: 0 !important;
-    }
-    
-    /* File uploader drop zone text */
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] {
-        min-width: 0 !important;
-        padding: 1rem !important;
-    }
-    
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] > div {
-        display: flex !important;
-        flex-direction: column !important;
-        align-items: center !important;
-        text-align: center !important;
-        min-width: 0 !important;
-    }
-    
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] span,
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] p,
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] small {
-        white-space: normal !important;
-        word-wrap: break-word !important;
-        overflow-wrap: break-word !important;
-        text-align: center !important;
-        max-width: 100% !important;
-    }
-    
-    /* File uploader button */
-    [data-testid="stFileUploader"] button {
-        background: var(--gradient-button) !important;
-        color: #ffffff !important;
-        font-weight: 600 !important;
-        white-space: nowrap !important;
-    }
-    
-    [data-testid="stFileUploader"] button * {
-        color: #ffffff !important;
-    }
-    
-    /* File list in uploader */
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"] {
-        background: rgba(34, 211, 238, 0.1) !important;
-        border-radius: 8px !important;
-        padding: 0.5rem !important;
-        margin: 0.25rem 0 !important;
-        min-width: 0 !important;
-    }
-    
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"] > div {
-        min-width: 0 !important;
-        overflow: hidden !important;
-    }
-    
-    [data-testid="stFileUploader"] [data-testid="stFileUploaderFile"] span {
-        overflow: hidden !important;
-        text-overflow: ellipsis !important;
-        white-space: nowrap !important;
-        max-width: 100% !important;
-        display: block !important;
-    }
-    
-    /* metrics */
-    [data-testid="stMetricValue"] {
-        color: var(--accent-cyan) !important;
-        font-weight: 700 !important;
-        font-size: 2.5rem !important;
-    }
-    
-    [data-testid="stMetricLabel"] {
-        color: var(--text-muted) !important;
-    }
-    
-    /* expander */
-    .streamlit-expanderHeader {
-        background: var(--bg-card) !important;
-        border-radius: 12px !important;
-        color: var(--text-primary) !important;
-        font-weight: 500 !important;
-        border: 1px solid var(--border-subtle) !important;
-    }
-    
-    .streamlit-expanderContent {
-        background: var(--bg-card);
-        border-radius: 0 0 12px 12px;
-        border: 1px solid var(--border-subtle);
-        border-top: none;
-    }
-    
-    /* info and warning boxes */
-    .stAlert {
-        background: var(--bg-card) !important;
-        border-radius: 14px !important;
-        color: var(--text-secondary) !important;
-        border: 1px solid var(--border-subtle) !important;
-    }
-    
-    /* success message */
-    div[data-testid="stAlert"][data-baseweb="notification"] {
-        background: rgba(34, 197, 94, 0.15) !important;
-        border: 1px solid rgba(34, 197, 94, 0.4) !important;
-    }
-    
-    /* error message */
-    .stError, .element-container .stAlert:has([data-testid="stAlertContentError"]) {
-        background: rgba(239, 68, 68, 0.15) !important;
-        border: 1px solid rgba(239, 68, 68, 0.4) !important;
-    }
-    
-    /* caption text */
-    .stCaption, [data-testid="stCaptionContainer"] {
-        color: var(--text-muted) !important;
-        font-size: 0.9rem !important;
-    }
-    
-    /* custom dark card class with glow effect */
-    .dark-card {
-        background: var(--bg-card);
-        border-radius: 20px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid var(--border-subtle);
-        transition: all 0.3s ease;
-    }
-    
-    .dark-card:hover {
-        border-color: var(--border-accent);
-        box-shadow: var(--shadow-glow-cyan);
-        transform: translateY(-2px);
-    }
-    
-    .dark-card h4 {
-        color: var(--accent-cyan) !important;
-        margin-top: 0 !important;
-        margin-bottom: 0.75rem !important;
-        font-size: 1.1rem !important;
-        font-weight: 600 !important;
-    }
-    
-    .dark-card p {
-        color: var(--text-secondary) !important;
-        margin: 0.5rem 0 !important;
-        font-size: 0.95rem !important;
-    }
-    
-    .dark-card strong {
-        color: var(--text-primary) !important;
-    }
-    
-    /* purple glow variant */
-    .dark-card-purple:hover {
-        border-color: rgba(168, 85, 247, 0.4);
-        box-shadow: var(--shadow-glow-purple);
-    }
-    
-    /* response card styling with enhanced glow */
-    .response-card {
-        background: linear-gradient(135deg, rgba(34, 211, 238, 0.1) 0%, rgba(168, 85, 247, 0.1) 100%);
-        border-radius: 20px;
-        padding: 1.75rem;
-        margin: 1.5rem 0;
-        border: 1px solid rgba(34, 211, 238, 0.3);
-        box-shadow: var(--shadow-glow-mixed);
-    }
-    
-    .response-card p {
-        color: var(--text-primary) !important;
-        font-size: 1rem !important;
-        line-height: 1.8 !important;
-    }
-    
-    /* chat messages with colored accents */
-    .chat-user {
-        background: linear-gradient(135deg, rgba(168, 85, 247, 0.15) 0%, rgba(236, 72, 153, 0.1) 100%);
-        border-radius: 18px;
-        padding: 1.25rem 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid rgba(168, 85, 247, 0.3);
-        border-left: 4px solid var(--accent-purple);
-    }
-    
-    .chat-assistant {
-        background: linear-gradient(135deg, rgba(34, 211, 238, 0.12) 0%, rgba(45, 212, 191, 0.08) 100%);
-        border-radius: 18px;
-        padding: 1.25rem 1.5rem;
-        margin: 1rem 0;
-        border: 1px solid rgba(34, 211, 238, 0.3);
-        border-left: 4px solid var(--accent-cyan);
-    }
-    
-    .chat-user p, .chat-assistant p {
-        color: var(--text-primary) !important;
-        margin: 0 !important;
-        font-size: 0.95rem !important;
-    }
-    
-    .chat-label {
-        font-weight: 700 !important;
-        color: var(--text-muted) !important;
-        font-size: 0.75rem !important;
-        margin-bottom: 0.5rem !important;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-    }
-    
-    /* sidebar brand header */
-    .sidebar-header {
-        padding: 1.5rem 0.5rem;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    
-    .sidebar-brand {
-        font-size: 1.6rem !important;
-        font-weight: 800 !important;
-        background: var(--gradient-primary);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-        margin: 0 !important;
-        letter-spacing: -0.02em;
-    }
-    
-    .sidebar-tagline {
-        color: var(--text-muted) !important;
-        font-size: 0.8rem !important;
-        margin-top: 0.25rem !important;
-    }
-    
-    /* sidebar nav title - plain text, not a button */
-    .nav-title {
-        color: var(--text-muted) !important;
-        font-size: 0.75rem !important;
-        font-weight: 600 !important;
-        text-transform: uppercase;
-        letter-spacing: 0.15em;
-        margin-bottom: 0.75rem !important;
-        padding-left: 0.25rem;
-    }
-    
-    /* hide default streamlit elements - but NOT the sidebar controls */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    /* Note: Don't hide header as it contains sidebar toggle controls */
-    
-    /* RADIO BUTTON STYLING - Hide the label completely */
-    [data-testid="stSidebar"] .stRadio > div:first-child {
-        display: none !important;
-    }
-    
-    .stRadio > div {
-        display: flex;
-        flex-direction: column;
-        gap: 0.5rem;
-    }
-    
-    .stRadio > label {
-        display: none !important;
-    }
-    
-    .stRadio [role="radiogroup"] {
-        gap: 0.5rem;
-    }
-    
-    .stRadio [role="radiogroup"] > label {
-        background: var(--bg-card) !important;
-        border-radius: 14px !important;
-        padding: 1rem 1.25rem !important;
-        margin: 0 !important;
-        cursor: pointer !important;
-        transition: all 0.3s ease !important;
-        border: 1px solid var(--border-subtle) !important;
-        display: flex !important;
-        align-items: center !important;
-        color: var(--text-secondary) !important;
-        font-weight: 500 !important;
-        font-size: 0.95rem !important;
-    }
-    
-    .stRadio [role="radiogroup"] > label:hover {
-        background: var(--bg-card-hover) !important;
-        border-color: var(--accent-cyan) !important;
-        color: var(--text-primary) !important;
-        box-shadow: var(--shadow-glow-cyan) !important;
-        transform: translateX(4px);
-    }
-    
-    .stRadio [role="radiogroup"] > label[data-checked="true"],
-    .stRadio [role="radiogroup"] > label:has(input:checked) {
-        background: linear-gradient(135deg, rgba(34, 211, 238, 0.2) 0%, rgba(168, 85, 247, 0.2) 100%) !important;
-        border-color: var(--accent-cyan) !important;
-        color: var(--text-primary) !important;
-        box-shadow: var(--shadow-glow-cyan) !important;
-    }
-    
-    /* divider with gradient */
-    hr {
-        border: none;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, var(--border-subtle), transparent);
-        margin: 2rem 0;
-    }
-    
-    /* spinner */
-    .stSpinner > div {
-        border-top-color: var(--accent-cyan) !important;
-    }
-    
-    /* progress bar with gradient */
-    .stProgress > div > div {
-        background: var(--gradient-primary) !important;
-        border-radius: 10px !important;
-    }
-    
-    .stProgress > div {
-        background: var(--bg-card) !important;
-        border-radius: 10px !important;
-    }
-    
-    /* tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0.75rem;
-        background: transparent;
-        border-bottom: 2px solid var(--border-subtle);
-        padding-bottom: 0;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border-radius: 10px 10px 0 0;
-        color: var(--text-muted);
-        padding: 0.85rem 1.75rem;
-        font-weight: 500;
-        border: none;
-        border-bottom: 3px solid transparent;
-        transition: all 0.3s ease;
-    }
-    
-    .stTabs [data-baseweb="tab"]:hover {
-        color: var(--text-primary);
-        background: rgba(34, 211, 238, 0.05);
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: transparent !important;
-        color: var(--accent-cyan) !important;
-        border-bottom: 3px solid var(--accent-cyan) !important;
-    }
-    
-    .stTabs [data-baseweb="tab-panel"] {
-        padding-top: 2rem;
-    }
-    
-    /* stat card for metrics with glow */
-    .stat-card {
-        background: var(--bg-card);
-        border-radius: 20px;
-        padding: 1.5rem;
-        text-align: center;
-        border: 1px solid var(--border-subtle);
-        transition: all 0.3s ease;
-    }
-    
-    .stat-card:hover {
-        border-color: var(--accent-cyan);
-        box-shadow: var(--shadow-glow-cyan);
-        transform: translateY(-3px);
-    }
-    
-    .stat-value {
-        font-size: 2.5rem;
-        font-weight: 800;
-        background: var(--gradient-primary);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .stat-label {
-        color: var(--text-muted);
-        font-size: 0.9rem;
-        font-weight: 500;
-        margin-top: 0.5rem;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    /* section title styling */
-    .section-title {
-        color: var(--text-muted) !important;
-        font-size: 0.75rem !important;
-        font-weight: 600 !important;
-        text-transform: uppercase;
-        letter-spacing: 0.15em;
-        margin-bottom: 0.75rem !important;
-        padding-left: 0.25rem;
-    }
-    
-    /* feature card in sidebar */
-    .feature-card {
-        background: var(--bg-card);
-        border-radius: 14px;
-        padding: 1rem 1.25rem;
-        margin: 0.5rem 0;
-        border: 1px solid var(--border-subtle);
-        transition: all 0.3s ease;
-    }
-    
-    .feature-card:hover {
-        border-color: var(--border-accent);
-        box-shadow: var(--shadow-glow-cyan);
-        transform: translateY(-2px);
-    }
-    
-    .feature-card-purple:hover {
-        border-color: rgba(168, 85, 247, 0.4);
-        box-shadow: var(--shadow-glow-purple);
-    }
-    
-    .feature-title {
-        font-size: 0.95rem !important;
-        font-weight: 600 !important;
-        margin-bottom: 0.25rem !important;
-    }
-    
-    .feature-desc {
-        font-size: 0.8rem !important;
-        color: var(--text-muted) !important;
-        margin: 0 !important;
-        line-height: 1.5 !important;
-    }
-    
-    /* content container card */
-    .content-card {
-        background: var(--bg-card);
-        border-radius: 24px;
-        padding: 2rem;
-        margin: 1.5rem 0;
-        border: 1px solid var(--border-subtle);
-        transition: all 0.3s ease;
-    }
-    
-    .content-card:hover {
-        border-color: rgba(34, 211, 238, 0.2);
-    }
-    
-    .content-card-header {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        margin-bottom: 1rem;
-        padding-bottom: 1rem;
-        border-bottom: 1px solid var(--border-subtle);
-    }
-    
-    .content-card-icon {
-        width: 40px;
-        height: 40px;
-        background: var(--gradient-primary);
-        border-radius: 12px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.25rem;
-        box-shadow: 0 0 20px rgba(34, 211, 238, 0.3);
-    }
-    
-    .content-card-title {
-        font-size: 1.2rem !important;
-        font-weight: 600 !important;
-        color: var(--text-primary) !important;
-        margin: 0 !important;
-    }
-    
-    /* accessibility - focus states */
-    *:focus-visible {
-        outline: 2px solid var(--accent-cyan) !important;
-        outline-offset: 2px !important;
-    }
-    
-    /* scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: var(--bg-primary);
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: var(--bg-card);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--bg-card-hover);
-    }
-    
-    /* reduced motion preference */
-    @media (prefers-reduced-motion: reduce) {
-        * {
-            transition: none !important;
-            animation: none !important;
-        }
-    }
-    
-    /* RESPONSIVE DESIGN - Handle narrow screens */
-    @media (max-width: 768px) {
-        .page-title {
-            font-size: 2.5rem !important;
-        }
-        
-        .page-subtitle {
-            font-size: 1rem !important;
-        }
-        
-        .content-card {
-            padding: 1.25rem !important;
-        }
-        
-        .content-card-title {
-            font-size: 1rem !important;
-        }
-        
-        .stFileUploader {
-            padding: 1rem !important;
-        }
-        
-        [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] {
-            padding: 0.75rem !important;
-        }
-        
-        [data-testid="stFileUploader"] [data-testid="stFileUploaderDropzone"] span {
-            font-size: 0.85rem !important;
-        }
-        
-        .stButton > button {
-            padding: 0.6rem 1rem !important;
-            font-size: 0.9rem !important;
-        }
-    }
-    
-    @media (max-width: 500px) {
-        .page-title {
-            font-size: 2rem !important;
-        }
-        
-        .main .block-container {
-            padding: 1rem !important;
-        }
-        
-        .content-card {
-            padding: 1rem !important;
-            border-radius: 16px !important;
-        }
-        
-        .dark-card {
-            padding: 1rem !important;
-            border-radius: 14px !important;
-        }
-    }
-    
-    /* SIDEBAR TOGGLE BUTTONS - keep visible but minimal */
-    [data-testid="collapsedControl"] {
-        display: flex !important;
-        visibility: visible !important;
-        opacity: 1 !important;
-        position: fixed !important;
-        left: 0.75rem !important;
-        top: 0.75rem !important;
-        z-index: 999999 !important;
-    }
-
-    [data-testid="collapsedControl"] > button,
-    [data-testid="baseButton-header"] {
-        background: #ffffff !important;
-        border: 1px solid #cfd8e8 !important;
-        border-radius: 10px !important;
-        color: #1f2a44 !important;
-        width: 42px !important;
-        height: 42px !important;
-        box-shadow: 0 2px 8px rgba(16, 24, 40, 0.08) !important;
-    }
-
-    [data-testid="collapsedControl"] > button:hover,
-    [data-testid="baseButton-header"]:hover {
-        background: #f8fbff !important;
-        border-color: #2f6fec !important;
-        color: #14213d !important;
-        transform: none !important;
-        box-shadow: 0 4px 12px rgba(47, 111, 236, 0.16) !important;
-    }
-
-    /* FINAL OVERRIDES: clean, light, bold, simplified UI */
-    .stApp {
-        background: linear-gradient(180deg, #f6f9ff 0%, #f3f7ff 100%) !important;
-    }
-
-    .main .block-container {
-        padding: 1.5rem 2rem !important;
-        max-width: 1220px !important;
-    }
-
-    [data-testid="stSidebar"] {
-        background: #eef3fb !important;
-        border-right: 1px solid #d3deef !important;
-        box-shadow: none !important;
-    }
-
-    .sidebar-brand {
-        color: #16233b !important;
-        -webkit-text-fill-color: #16233b !important;
-        background: none !important;
-        font-size: 1.25rem !important;
-        font-weight: 800 !important;
-    }
-
-    .sidebar-tagline {
-        color: #4f6385 !important;
-    }
-
-    .nav-title {
-        color: #334768 !important;
-        font-size: 0.72rem !important;
-        letter-spacing: 0.1em !important;
-    }
-
-    .feature-card,
-    .dark-card,
-    .content-card,
-    .response-card,
-    .stat-card {
-        background: #ffffff !important;
-        border: 1px solid #d8e2f0 !important;
-        border-radius: 14px !important;
-        box-shadow: 0 4px 14px rgba(18, 36, 76, 0.06) !important;
-    }
-
-    .feature-card:hover,
-    .dark-card:hover,
-    .content-card:hover,
-    .stat-card:hover {
-        transform: none !important;
-        border-color: #bccbe4 !important;
-        box-shadow: 0 6px 16px rgba(18, 36, 76, 0.09) !important;
-    }
-
-    .feature-title,
-    .content-card-title,
-    .chat-label {
-        color: #14213d !important;
-    }
-
-    .feature-desc,
-    .page-subtitle,
-    .stCaption,
-    [data-testid="stCaptionContainer"] {
-        color: #4f6385 !important;
-    }
-
-    .page-title {
-        color: #0f1d35 !important;
-        background: none !important;
-        -webkit-text-fill-color: #0f1d35 !important;
-        font-size: 2.7rem !important;
-        font-weight: 800 !important;
-        letter-spacing: -0.01em !important;
-    }
-
-    .content-card-icon {
-        background: #e8f0ff !important;
-        color: #2d5fd5 !important;
-        box-shadow: none !important;
-    }
-
-    .chat-user {
-        background: #eef4ff !important;
-        border: 1px solid #c9dafb !important;
-        border-left: 4px solid #3f7cf0 !important;
-    }
-
-    .chat-assistant {
-        background: #f3f6fb !important;
-        border: 1px solid #d7e0ed !important;
-        border-left: 4px solid #0f766e !important;
-    }
-
-    .chat-user p,
-    .chat-assistant p,
-    p,
-    span,
-    li {
-        color: #243555 !important;
-    }
-
-    h1, h2, h3, h4, h5, h6,
-    label, .stMarkdown, .stText, .stAlert, .stInfo, .stSuccess, .stWarning {
-        color: #14213d !important;
-    }
-
-    h4 {
-        color: #1d4ed8 !important;
-    }
-
-    .stTextInput > div > div > input,
-    [data-testid="stFileUploader"],
-    .streamlit-expanderHeader,
-    .streamlit-expanderContent {
-        background: #ffffff !important;
-        border: 1px solid #ccd7ea !important;
-        color: #14213d !important;
-    }
-
-    .stTextInput > div > div > input::placeholder {
-        color: #7285a4 !important;
-    }
-
-    .stButton > button {
-        background: #1d4ed8 !important;
-        color: #ffffff !important;
-        border: 1px solid #1e40af !important;
-        border-radius: 10px !important;
-        box-shadow: 0 4px 10px rgba(29, 78, 216, 0.2) !important;
-        text-shadow: none !important;
-        font-weight: 700 !important;
-    }
-
-    .stButton > button:hover {
-        background: #1e40af !important;
-        transform: none !important;
-        box-shadow: 0 6px 12px rgba(29, 78, 216, 0.24) !important;
-    }
-
-    .stButton > button[kind="secondary"] {
-        background: #ffffff !important;
-        color: #1d4ed8 !important;
-        border: 1px solid #b9c9e8 !important;
-        box-shadow: none !important;
-    }
-
-    .stButton > button[kind="secondary"]:hover {
-        background: #f8fbff !important;
-        border-color: #1d4ed8 !important;
-    }
-
-    .stRadio > div {
-        background: #ffffff !important;
-        border: 1px solid #d3deef !important;
-        border-radius: 12px !important;
-        padding: 0.35rem !important;
-    }
-
-    .stRadio [role="radiogroup"] label {
-        border-radius: 10px !important;
-        padding: 0.35rem 0.5rem !important;
-    }
-
-    .stRadio [aria-checked="true"] {
-        background: #e8f0ff !important;
-    }
-
-    .stTabs [data-baseweb="tab-list"] {
-        border-bottom: 1px solid #ccd7ea !important;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        color: #5a6f90 !important;
-    }
-
-    .stTabs [aria-selected="true"] {
-        color: #14213d !important;
-        border-bottom-color: #1d4ed8 !important;
-    }
-
-    .sidebar-chat-history {
-        color: #263a5c !important;
-    }
-
-    [data-testid="stSidebar"] .stButton > button {
-        background: #ffffff !important;
-        border: 1px solid #ccd7ea !important;
-        color: #1f2a44 !important;
-        box-shadow: none !important;
-    }
-
-    [data-testid="stSidebar"] .stButton > button:hover {
-        background: #f8fbff !important;
-        border-color: #1d4ed8 !important;
-        color: #14213d !important;
-        box-shadow: none !important;
-    }
-
-    [data-testid="stSidebar"] .stButton > button[kind="primary"] {
-        background: #1d4ed8 !important;
-        border: 1px solid #1e40af !important;
-        color: #ffffff !important;
-    }
-
-    .stRadio [role="radiogroup"] > label {
-        background: #ffffff !important;
-        border: 1px solid #ccd7ea !important;
-        color: #263a5c !important;
-        box-shadow: none !important;
-    }
-
-    .stRadio [role="radiogroup"] > label:hover {
-        background: #f8fbff !important;
-        border-color: #9ab4e7 !important;
-        color: #14213d !important;
-        transform: none !important;
-        box-shadow: none !important;
-    }
-
-    .stRadio [role="radiogroup"] > label[data-checked="true"],
-    .stRadio [role="radiogroup"] > label:has(input:checked) {
-        background: #e8f0ff !important;
-        border-color: #2f6fec !important;
-        color: #14213d !important;
-        box-shadow: none !important;
-    }
-
-    hr {
-        background: linear-gradient(90deg, transparent, #cfd9ea, transparent) !important;
-    }
-
-    /* UX refresh: larger scale, pastel palette, quieter motion */
-    :root {
-        --pastel-bg: #f6f7fe;
-        --pastel-surface: #ffffff;
-        --pastel-surface-soft: #f1f4ff;
-        --pastel-border: #d8def1;
-        --pastel-text: #1f2940;
-        --pastel-muted: #62718f;
-        --pastel-primary: #7a8fe8;
-        --pastel-primary-strong: #647ddf;
-        --pastel-accent: #8bcfc3;
-        --pastel-shadow: 0 10px 26px rgba(79, 96, 148, 0.10);
-        --ease-out-smooth: cubic-bezier(0.22, 1, 0.36, 1);
-    }
-
-    .stApp {
-        font-family: 'Plus Jakarta Sans', 'Inter', -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif !important;
-        background: linear-gradient(180deg, #f6f7fe 0%, #f3f5ff 100%) !important;
-        color: var(--pastel-text) !important;
-    }
-
-    .main .block-container {
-        max-width: 1320px !important;
-        padding: 2rem 2.25rem 2.25rem !important;
-    }
-
-    [data-testid="stSidebar"] {
-        background: #edf1fb !important;
-        border-right: 1px solid var(--pastel-border) !important;
-        min-width: 300px !important;
-        max-width: 340px !important;
-    }
-
-    .page-title {
-        font-size: clamp(2.25rem, 3.4vw, 3.3rem) !important;
-        font-weight: 800 !important;
-        color: #222d46 !important;
-        margin-bottom: 0.65rem !important;
-        animation: fadeSlideIn 420ms var(--ease-out-smooth);
-    }
-
-    .page-subtitle {
-        font-size: 1.08rem !important;
-        line-height: 1.65 !important;
-        color: var(--pastel-muted) !important;
-        margin-bottom: 2rem !important;
-    }
-
-    .content-card,
-    .feature-card,
-    .dark-card,
-    .response-card,
-    .stat-card {
-        background: var(--pastel-surface) !important;
-        border: 1px solid var(--pastel-border) !important;
-        border-radius: 16px !important;
-        box-shadow: var(--pastel-shadow) !important;
-        transition: transform 220ms var(--ease-out-smooth), box-shadow 220ms var(--ease-out-smooth), border-color 220ms var(--ease-out-smooth);
-    }
-
-    .content-card:hover,
-    .feature-card:hover,
-    .dark-card:hover,
-    .response-card:hover,
-    .stat-card:hover {
-        transform: translateY(-2px) !important;
-        border-color: #c6d0ee !important;
-        box-shadow: 0 12px 30px rgba(79, 96, 148, 0.14) !important;
-    }
-
-    .content-card-title,
-    .feature-title,
-    .chat-label {
-        font-size: 1.1rem !important;
-        font-weight: 700 !important;
-        color: var(--pastel-text) !important;
-    }
-
-    .feature-desc,
-    p, span, li {
-        color: var(--pastel-muted) !important;
-        font-size: 1rem !important;
-        line-height: 1.65 !important;
-    }
+# avatars for the native chat bubbles on both chat pages
+CHAT_AVATARS = {"user": "👤", "assistant": "🤖"}
 
-    .stButton > button {
-        background: linear-gradient(135deg, #8094ea 0%, #92a3ee 100%) !important;
-        border: 1px solid #748add !important;
-        color: #ffffff !important;
-        font-size: 1rem !important;
-        font-weight: 700 !important;
-        min-height: 48px !important;
-        padding: 0.75rem 1.05rem !important;
-        border-radius: 12px !important;
-        box-shadow: 0 8px 18px rgba(101, 124, 209, 0.24) !important;
-        transition: transform 170ms var(--ease-out-smooth), box-shadow 170ms var(--ease-out-smooth), background 170ms var(--ease-out-smooth) !important;
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        background: linear-gradient(135deg, #7289e4 0%, #869aeb 100%) !important;
-        box-shadow: 0 10px 22px rgba(101, 124, 209, 0.30) !important;
-    }
+# friendly names for the tools listed under personal chat answers
+TOOL_LABELS = {"semantic_search_personal": "my info", "get_weather": "weather", "web_search": "web search", "github_search": "GitHub"}
 
-    .stButton > button:active {
-        transform: translateY(0) scale(0.99) !important;
-    }
-
-    .stTextInput > div > div > input {
-        background: #ffffff !important;
-        border: 1px solid #cfd8f0 !important;
-        border-radius: 12px !important;
-        min-height: 50px !important;
-        font-size: 1rem !important;
-        color: #1f2940 !important;
-        transition: border-color 180ms var(--ease-out-smooth), box-shadow 180ms var(--ease-out-smooth), transform 180ms var(--ease-out-smooth) !important;
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: #8ea0ea !important;
-        box-shadow: 0 0 0 4px rgba(122, 143, 232, 0.16) !important;
-        transform: translateY(-1px);
-    }
-
-    [data-testid="stSidebar"] .stButton > button {
-        background: #ffffff !important;
-        border: 1px solid var(--pastel-border) !important;
-        color: #30405f !important;
-        min-height: 42px !important;
-    }
-
-    [data-testid="stSidebar"] .stButton > button:hover {
-        background: #f6f8ff !important;
-        border-color: #b7c5ee !important;
-        color: #243451 !important;
-        transform: translateY(-1px) !important;
-    }
-
-    [data-testid="stSidebar"] .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #8094ea 0%, #92a3ee 100%) !important;
-        border: 1px solid #748add !important;
-        color: #ffffff !important;
-    }
-
-    .chat-user {
-        background: #edf2ff !important;
-        border: 1px solid #cad5f3 !important;
-        border-left: 4px solid #7b90e8 !important;
-    }
-
-    .chat-assistant {
-        background: #f2f7f6 !important;
-        border: 1px solid #d7e7e3 !important;
-        border-left: 4px solid #85cabc !important;
-    }
 
-    .tools-used-pill {
-        display: inline-flex;
-        flex-wrap: wrap;
-        gap: 0.35rem;
-        margin-top: 0.6rem;
-        font-size: 0.75rem;
-        color: var(--pastel-muted);
-    }
-    .tools-used-pill span {
-        background: #eef2ff;
-        border: 1px solid #c8d2f1;
-        border-radius: 999px;
-        padding: 0.2rem 0.6rem;
-        font-weight: 500;
-        color: #4f6385;
-    }
-
-    [data-testid="stFileUploader"] {
-        background: #ffffff !important;
-        border: 1px dashed #b8c6ea !important;
-        border-radius: 14px !important;
-        padding: 0.85rem !important;
-        min-height: 170px !important;
-        transition: border-color 200ms var(--ease-out-smooth), box-shadow 200ms var(--ease-out-smooth) !important;
-    }
-
-    [data-testid="stFileUploader"]:hover {
-        border-color: #8fa2e9 !important;
-        box-shadow: 0 8px 18px rgba(122, 143, 232, 0.15) !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] {
-        min-height: 140px !important;
-        align-items: center !important;
-        justify-content: center !important;
-        text-align: center !important;
-        padding: 0.75rem !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] * {
-        white-space: normal !important;
-        overflow-wrap: anywhere !important;
-        word-break: break-word !important;
-        font-size: 0.98rem !important;
-    }
-
-    .onboard-panel {
-        background: var(--pastel-surface-soft);
-        border: 1px solid #cfdaef;
-        border-radius: 14px;
-        padding: 0.95rem 1rem;
-        margin-bottom: 0.85rem;
-    }
-
-    .onboard-title {
-        font-size: 0.95rem;
-        font-weight: 700;
-        color: #2b3a57;
-        margin: 0 0 0.5rem 0;
-    }
-
-    .onboard-step {
-        display: flex;
-        gap: 0.5rem;
-        margin: 0.35rem 0;
-        color: #4f6286;
-        font-size: 0.9rem;
-    }
-
-    .history-empty-note {
-        color: #6b7da1 !important;
-        font-size: 0.83rem !important;
-        margin: 0.4rem 0 0 0 !important;
-        padding: 0.25rem 0.2rem 0 0.2rem;
-    }
-
-    .chat-history-active {
-        background: #edf2ff !important;
-        border-color: #c3d1f4 !important;
-    }
-
-    .sidebar-footer {
-        text-align: center;
-        padding: 1rem 0;
-    }
-
-    .sidebar-footer-label {
-        color: #5a6f90;
-        font-size: 0.7rem;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        margin: 0;
-    }
-
-    .sidebar-footer-value {
-        color: #1f2a44;
-        font-size: 0.85rem;
-        font-weight: 600;
-        margin: 0.5rem 0 0 0;
-    }
-
-    .spacer-xs {
-        height: 0.5rem;
-    }
-
-    .spacer-sm {
-        height: 1rem;
-    }
-
-    .spacer-md {
-        height: 1.5rem;
-    }
-
-    .chat-history-card {
-        padding: 0.72rem 0.88rem;
-        margin: 0.3rem 0;
-    }
-
-    .chat-history-title {
-        margin: 0;
-        font-size: 0.93rem;
-        color: #1f2940;
-        font-weight: 700;
-    }
-
-    .chat-history-date {
-        margin: 0.25rem 0 0 0;
-        font-size: 0.74rem;
-        color: #6b7da1;
-    }
-
-    .text-muted-sm {
-        color: #4f6385;
-        margin: 0;
-        font-size: 0.95rem;
-    }
-
-    .text-muted-xs {
-        color: #4f6385;
-        margin: 0;
-        font-size: 0.9rem;
-    }
-
-    .pre-wrap {
-        white-space: pre-wrap;
-    }
-
-    .no-margin-card {
-        margin: 0;
-    }
-
-    .content-card-spaced {
-        margin-bottom: 1.5rem;
-    }
-
-    .content-card-icon-search {
-        background: #eaf7f5;
-        color: #0f766e;
-    }
-
-    .context-pill {
-        padding: 0.75rem 1rem;
-        margin-bottom: 1rem;
-        background: #eef4ff;
-        border-color: #c9d9f6;
-    }
-
-    .context-pill-text {
-        margin: 0;
-        font-size: 0.8rem;
-        color: #4f6385;
-    }
-
-    .context-pill-strong-primary {
-        color: #1d4ed8;
-    }
-
-    .context-pill-strong-accent {
-        color: #0f766e;
-    }
-
-    .section-header-wrap {
-        margin-bottom: 1.5rem;
-    }
-
-    .section-subtitle {
-        color: #4f6385;
-        font-size: 0.9rem;
-        margin-top: 0.5rem;
-    }
-
-    .heading-inline-top {
-        margin-top: 1rem;
-    }
-
-    /* FINAL POLISH: balanced sizing, elegant typography, quieter palette */
-    html, body, [data-testid="stAppViewContainer"], .stApp {
-        font-size: 16px !important;
-    }
-
-    .stApp {
-        background: linear-gradient(180deg, #fbfaff 0%, #f7f8ff 55%, #f8fbff 100%) !important;
-    }
-
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #f3f0fb 0%, #edf1fd 100%) !important;
-        border-right: 1px solid #d9dcef !important;
-    }
-
-    [data-testid="stSidebar"][aria-expanded="true"] {
-        min-width: 290px !important;
-        max-width: 290px !important;
-    }
-
-    [data-testid="stSidebar"][aria-expanded="false"] {
-        min-width: 0 !important;
-        max-width: 0 !important;
-    }
-
-    .sidebar-brand {
-        font-family: 'Playfair Display', Georgia, serif !important;
-        font-size: 1.85rem !important;
-        font-weight: 600 !important;
-        color: #1f2540 !important;
-        -webkit-text-fill-color: #1f2540 !important;
-        letter-spacing: -0.01em !important;
-    }
-
-    .sidebar-tagline {
-        color: #6b7397 !important;
-        font-size: 0.85rem !important;
-    }
-
-    .main .block-container {
-        max-width: 1260px !important;
-        padding: 1.9rem 2.15rem 2.35rem !important;
-    }
-
-    .page-title {
-        font-family: 'Playfair Display', Georgia, serif !important;
-        font-size: clamp(2.35rem, 3.5vw, 3.25rem) !important;
-        font-weight: 600 !important;
-        letter-spacing: -0.01em !important;
-        color: #1f2540 !important;
-    }
-
-    .page-subtitle {
-        font-size: 1.08rem !important;
-        color: #5f688f !important;
-    }
-
-    .nav-title {
-        color: #2c3555 !important;
-        font-weight: 800 !important;
-        letter-spacing: 0.12em !important;
-    }
-
-    .content-card,
-    .feature-card,
-    .dark-card,
-    .response-card,
-    .stat-card {
-        border-radius: 16px !important;
-        border: 1px solid #d9def3 !important;
-        background: #ffffff !important;
-    }
-
-    .content-card-header {
-        margin-bottom: 1rem !important;
-        padding-bottom: 0.9rem !important;
-    }
-
-    .content-card-title,
-    .feature-title {
-        font-size: 1.14rem !important;
-        font-weight: 700 !important;
-        color: #26304d !important;
-    }
-
-    .feature-desc,
-    .text-muted-sm,
-    .text-muted-xs,
-    p, span, li {
-        font-size: 0.98rem !important;
-        line-height: 1.65 !important;
-        color: #434b64 !important;
-    }
-
-    .stButton > button {
-        min-height: 48px !important;
-        border-radius: 12px !important;
-        font-size: 0.98rem !important;
-        background: #101726 !important;
-        border: 1px solid #101726 !important;
-        color: #ffffff !important;
-        box-shadow: 0 8px 20px rgba(16, 23, 38, 0.18) !important;
-        transition: transform 170ms var(--ease-out-smooth), box-shadow 170ms var(--ease-out-smooth), background 170ms var(--ease-out-smooth) !important;
-    }
-
-    .stButton > button * {
-        color: #ffffff !important;
-    }
-
-    .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        background: #0b1220 !important;
-        box-shadow: 0 10px 24px rgba(16, 23, 38, 0.24) !important;
-        filter: none !important;
-    }
-
-    .stButton > button[kind="secondary"] {
-        background: #ffffff !important;
-        color: #1f2540 !important;
-        border: 1px solid #ccd4eb !important;
-        box-shadow: 0 4px 12px rgba(31, 37, 64, 0.08) !important;
-    }
-
-    .stButton > button[kind="secondary"] * {
-        color: #1f2540 !important;
-    }
-
-    .stButton > button[kind="secondary"]:hover {
-        background: #f7f9ff !important;
-        border-color: #b8c4e5 !important;
-    }
-
-    /* COLORIZE OVERRIDE: dark pink accent system */
-    :root {
-        --accent-pink-700: #97165b;
-        --accent-pink-600: #ad1d6a;
-        --accent-pink-500: #c02a78;
-        --accent-pink-200: #efc7dc;
-        --accent-pink-100: #f7e3ee;
-    }
-
-    .home-kicker {
-        color: var(--accent-pink-600) !important;
-    }
-
-    .stButton > button {
-        background: var(--accent-pink-600) !important;
-        border-color: var(--accent-pink-600) !important;
-        color: #ffffff !important;
-        box-shadow: 0 8px 18px rgba(173, 29, 106, 0.22) !important;
-    }
+@st.cache_resource
+def get_personal_answer_cache() -> tuple:
+    """
+    process-wide store of finished personal chat answers keyed on the message list
+    st.cache_data cant replay a live token stream, so answers are saved here once complete
+    returns tuple of (lock, OrderedDict) - every session's script thread shares the dict,
+    so reads and writes hold the lock; it lives here because app.py's own globals
+    are re-created on every rerun
+    """
+    return threading.Lock(), OrderedDict()
 
-    .stButton > button * {
-        color: #ffffff !important;
-    }
 
-    .stButton > button:hover {
-        background: var(--accent-pink-700) !important;
-        border-color: var(--accent-pink-700) !important;
-        box-shadow: 0 10px 22px rgba(151, 22, 91, 0.28) !important;
-    }
+def personal_cache_key(messages: list):
+    """
+    serializes the message list with sorted keys so equal conversations share a cache key
+    uses orjson when installed, otherwise the stdlib json module
+    """
+    if orjson is not None:
+        return orjson.dumps(messages, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(messages, sort_keys=True)
 
-    .stButton > button[kind="secondary"] {
-        background: #ffffff !important;
-        color: var(--accent-pink-700) !important;
-        border-color: var(--accent-pink-200) !important;
-        box-shadow: 0 4px 12px rgba(173, 29, 106, 0.08) !important;
-    }
 
-    .stButton > button[kind="secondary"] * {
-        color: var(--accent-pink-700) !important;
-    }
+def get_cached_personal_answer(messages: list):
+    """
+    looks up a finished answer for this exact conversation
+    returns tuple of (answer, tools_used) or none if missing or expired
+    """
+    key = personal_cache_key(messages)
+    lock, cache = get_personal_answer_cache()
+    with lock:
+        entry = cache.get(key)
+    if entry is None or time.time() - entry[0] > PERSONAL_CACHE_TTL:
+        return None
+    return entry[1], entry[2]
 
-    .stButton > button[kind="secondary"]:hover {
-        background: #fff8fc !important;
-        border-color: var(--accent-pink-500) !important;
-    }
 
-    .stTextInput > div > div > input:focus,
-    [data-testid="stTextInputRootElement"] input:focus {
-        border-color: var(--accent-pink-500) !important;
-        box-shadow: 0 0 0 4px rgba(192, 42, 120, 0.16) !important;
-    }
+def store_personal_answer(messages: list, answer: str, tools_used: list):
+    """
+    saves a finished answer for this conversation, evicting the oldest entries
+    once the cache is full
+    """
+    key = personal_cache_key(messages)
+    lock, cache = get_personal_answer_cache()
+    with lock:
+        cache[key] = (time.time(), answer, list(tools_used))
+        cache.move_to_end(key)
+        while len(cache) > PERSONAL_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label[data-checked="true"],
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label:has(input:checked) {
-        background: var(--accent-pink-700) !important;
-        border-color: var(--accent-pink-700) !important;
-        color: #ffffff !important;
-        box-shadow: 0 10px 20px rgba(151, 22, 91, 0.24) !important;
-    }
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label:hover {
-        border-color: var(--accent-pink-500) !important;
-    }
+def personal_chat_display_title(chat_data: dict) -> str:
+    """
+    builds the sidebar label for a chat, computed once per turn and stored as display_title
+    prefers meaningful titles; avoids repeating generic "new chat" items
+    """
+    raw_title = chat_data.get('title', 'Untitled Chat')
+    if raw_title.strip().lower() in {'new chat', 'untitled chat'} and chat_data.get('messages'):
+        first_user_msg = next((m['content'] for m in chat_data['messages'] if m.get('role') == 'user'), '')
+        raw_title = first_user_msg[:35] if first_user_msg else 'Untitled Chat'
 
-    .content-card-icon,
-    .content-card-icon-search {
-        background: var(--accent-pink-100) !important;
-        color: var(--accent-pink-700) !important;
-    }
+    title = raw_title[:32]
+    if len(raw_title) > 32:
+        title += '...'
+    return title
 
-    .chat-user {
-        border-left-color: var(--accent-pink-600) !important;
-        background: #fbf0f7 !important;
-        border-color: var(--accent-pink-200) !important;
-    }
 
-    .context-pill {
-        background: #fdf3f8 !important;
-        border-color: var(--accent-pink-200) !important;
-    }
+def stream_personal_answer(messages: list, tools_used: list):
+    """
+    runs the tool-calling loop for one personal chat turn, yielding answer tokens as they arrive
+    tool call deltas are accumulated until the response ends, then the tools run and
+    the loop continues with their results
+    names of the tools that ran are appended to tools_used
+    """
+    messages = list(messages)
+    tools = get_openai_tools()
+    while True:
+        stream = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            tools=tools,
+            tool_choice="auto",
+            stream=True,
+        )
+        content_parts = []
+        tool_calls = {}  # index -> {"id", "name", "arguments"} assembled from deltas
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+                yield delta.content
+            for tc in delta.tool_calls or []:
+                call = tool_calls.setdefault(tc.index, {"id": None, "name": "", "arguments": ""})
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function and tc.function.name:
+                    call["name"] += tc.function.name
+                if tc.function and tc.function.arguments:
+                    call["arguments"] += tc.function.arguments
+        if not tool_calls:
+            return
+        # one assistant message with all tool_calls
+        ordered_calls = [tool_calls[i] for i in sorted(tool_calls)]
+        tool_calls_for_api = [
+            {"id": call["id"], "type": "function", "function": {"name": call["name"], "arguments": call["arguments"] or "{}"}}
+            for call in ordered_calls
+        ]
+        messages.append({"role": "assistant", "content": "".join(content_parts) or None, "tool_calls": tool_calls_for_api})
+        loads = orjson.loads if orjson is not None else json.loads
+        tool_args = []
+        for call in ordered_calls:
+            try:
+                tool_args.append(loads(call["arguments"]) if call["arguments"] else {})
+            except json.JSONDecodeError:
+                tool_args.append({})
+            tools_used.append(call["name"])
+        # the tools are independent network/search calls, so several in one turn run side by side
+        # and the turn waits for the slowest one instead of their sum; results keep the call order
+        if len(ordered_calls) == 1:
+            results = [run_tool(ordered_calls[0]["name"], tool_args[0])]
+        else:
+            # the workers reach st.cache_data (embed_query) and st.cache_resource (get_encoder),
+            # so they get this session's script context like the script thread has
+            ctx = get_script_run_ctx()
+            with ThreadPoolExecutor(
+                max_workers=len(ordered_calls),
+                initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+            ) as executor:
+                results = list(executor.map(run_tool, [call["name"] for call in ordered_calls], tool_args))
+        for call, result in zip(ordered_calls, results):
+            messages.append({"role": "tool", "tool_call_id": call["id"], "content": result})
 
-    .context-pill-strong-primary {
-        color: var(--accent-pink-700) !important;
-    }
 
-    .stat-value {
-        color: var(--accent-pink-700) !important;
-    }
+def get_resume_manager():
+    """
+    gets or creates the resume manager from session state
+    keeps the manager persistent across reruns
+    """
+    if 'resume_manager' not in st.session_state:
+        st.session_state.resume_manager = ResumeManager(model=get_encoder())
+    return st.session_state.resume_manager
 
-    .section-header-icon {
-        background: var(--accent-pink-600) !important;
-        box-shadow: 0 0 0 4px rgba(173, 29, 106, 0.16) !important;
-    }
 
-    /* bolder select mode controls in sidebar */
-    [data-testid="stSidebar"] .stRadio > div {
-        background: transparent !important;
-        border: none !important;
-        padding: 0 !important;
-    }
+def init_conversation_context():
+    """
+    initializes conversation context tracking for better multi-turn awareness
+    tracks which candidates have been mentioned and the conversation flow
+    """
+    if 'chat_history' not in st.session_state:
+        st.session_state.chat_history = []
+    
+    if 'conversation_context' not in st.session_state:
+        st.session_state.conversation_context = {
+            'last_candidate': None,
+            'last_query_type': None,
+            'mentioned_candidates': set()
+        }
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] {
-        gap: 0.6rem !important;
-    }
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label {
-        background: #eef2ff !important;
-        border: 1px solid #c8d2f1 !important;
-        border-radius: 12px !important;
-        min-height: 46px !important;
-        padding: 0.7rem 0.85rem !important;
-        color: #2f385a !important;
-        font-weight: 700 !important;
-        transition: transform 170ms var(--ease-out-smooth), background 170ms var(--ease-out-smooth), color 170ms var(--ease-out-smooth), box-shadow 170ms var(--ease-out-smooth) !important;
-    }
+# one compiled pattern classifies the query - the group name is the query type
+QUERY_TYPE_RE = re.compile(
+    r"\b(?:(?P<comparison>compare|versus|vs|both|difference|between)"
+    r"|(?P<search>who|which candidate|find|anyone|best|most)"
+    r"|(?P<follow_up>tell me more|what about|their|them|summarize|elaborate))\b"
+)
+QUERY_TYPE_PRIORITY = ('comparison', 'search', 'follow_up')
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label input {
-        display: none !important;
-        opacity: 0 !important;
-        width: 0 !important;
-        height: 0 !important;
-        margin: 0 !important;
-    }
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label > div:first-child {
-        display: none !important;
-    }
+def build_name_matcher(candidate_names: list, candidate_name_terms: list):
+    """
+    builds one compiled pattern over every candidate's casefolded full name and name parts
+    the lookahead lets matches overlap so a single scan finds every name a substring check would
+    returns tuple of (pattern, dict of casefolded term -> candidate names)
+    """
+    term_to_names = {}
+    for candidate_name, terms in zip(candidate_names, candidate_name_terms):
+        for term in terms:
+            term_to_names.setdefault(term, set()).add(candidate_name)
+    if not term_to_names:
+        return None, term_to_names
+    # only the longest term matches at each position, so it also carries the names of any term that is its prefix
+    term_to_names = {
+        term: set().union(*(names for other, names in term_to_names.items() if term.startswith(other)))
+        for term in term_to_names
+    }
+    alternation = "|".join(re.escape(term) for term in sorted(term_to_names, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), term_to_names
+
+
+def get_name_matcher(resume_manager):
+    """
+    returns the name matcher for the current resumes
+    cached in session state against the manager's version counter so it only rebuilds on upload/remove
+    """
+    cache_key = (id(resume_manager), resume_manager.version)
+    cached = st.session_state.get('name_matcher')
+    if cached is None or cached[0] != cache_key:
+        matcher = build_name_matcher(resume_manager.candidate_names, resume_manager.candidate_name_terms)
+        st.session_state.name_matcher = cached = (cache_key, matcher)
+    return cached[1]
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label:hover {
-        background: #f7e8f1 !important;
-        border-color: #e3b3cb !important;
-        transform: translateX(2px) !important;
-        box-shadow: 0 6px 16px rgba(151, 22, 91, 0.10) !important;
-    }
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label[data-checked="true"],
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label:has(input:checked) {
-        background: #f6dce8 !important;
-        border-color: #d888b1 !important;
-        color: #79124a !important;
-        box-shadow: 0 8px 18px rgba(151, 22, 91, 0.14) !important;
-    }
+@st.cache_resource(max_entries=32, show_spinner=False)
+def build_mention_pattern(candidate_names: tuple):
+    """
+    compiles one case-insensitive alternation over the given (non-empty) candidate names, longest first
+    cached per sorted tuple of names so a conversation only compiles it when a new candidate is mentioned
+    (st.cache_resource rather than lru_cache - this script is re-executed every rerun)
+    returns tuple of (pattern, dict of lowercased name -> candidate name)
+    """
+    lower_to_name = {name.lower(): name for name in candidate_names}
+    alternation = "|".join(re.escape(name) for name in sorted(lower_to_name, key=len, reverse=True))
+    return re.compile(alternation, re.IGNORECASE), lower_to_name
 
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label[data-checked="true"] *,
-    [data-testid="stSidebar"] .stRadio [role="radiogroup"] > label:has(input:checked) * {
-        color: #79124a !important;
-    }
 
-    .stTextInput > div > div > input {
-        min-height: 58px !important;
-        border-radius: 12px !important;
-        font-size: 1rem !important;
-        line-height: 58px !important;
-        padding: 0 1rem !important;
-        border: 1px solid #ccd3ee !important;
-        background: #ffffff !important;
-        box-sizing: border-box !important;
-    }
+def update_conversation_context(query: str, resume_manager):
+    """
+    updates conversation context based on the query and available candidates
+    helps the LLM understand who is being discussed in follow-up questions
+    """
+    context = st.session_state.conversation_context
+    # casefold once - candidate name terms were casefolded when the resumes were added
+    query_cf = query.casefold()
+    
+    # extract candidate names mentioned in the query with one scan over the query
+    if resume_manager.candidate_names:
+        pattern, term_to_names = get_name_matcher(resume_manager)
+        if pattern is not None:
+            found = set()
+            for match in pattern.finditer(query_cf):
+                found |= term_to_names[match.group(1)]
+            # keep upload order so last_candidate matches the previous behavior
+            matched = [name for name in resume_manager.candidate_names if name in found]
+            if matched:
+                context['mentioned_candidates'].update(matched)
+                context['last_candidate'] = matched[-1]
+    
+    # detect query type for better context handling
+    # comparison wins over search, which wins over follow-up, wherever they appear in the query
+    found_types = {match.lastgroup for match in QUERY_TYPE_RE.finditer(query_cf)}
+    context['last_query_type'] = next((t for t in QUERY_TYPE_PRIORITY if t in found_types), 'general')
 
-    .stTextInput > div > div > input:focus {
-        box-shadow: 0 0 0 4px rgba(161, 154, 237, 0.16) !important;
-        border-color: #a6a0ee !important;
-    }
 
-    /* keep all query bars white and vertically centered */
-    [data-testid="stTextInputRootElement"] input {
-        background: #ffffff !important;
-        color: #25314e !important;
-        height: 58px !important;
-        min-height: 58px !important;
-        line-height: 58px !important;
-        padding: 0 1rem !important;
-        box-sizing: border-box !important;
-        margin: 0 !important;
-    }
+def get_all_candidates_summary(resume_manager) -> str:
+    """
+    creates a concise summary of all uploaded candidates for context
+    helps the LLM keep track of who is in the database
+    """
+    if not resume_manager.candidate_names:
+        return "No candidates uploaded yet."
+    
+    return '\n'.join(
+        f"• {name}: {role} | {years} years exp | Skills: {skills}"
+        for name, role, years, skills in zip(
+            resume_manager.candidate_names,
+            resume_manager.candidate_roles,
+            resume_manager.candidate_experience,
+            resume_manager.candidate_skills_text,
+        )
+    )
 
-    [data-testid="stTextInputRootElement"] input::placeholder {
-        color: #556083 !important;
-        line-height: 58px !important;
-    }
 
-    /* remove default form box so composer feels clean */
-    [data-testid="stForm"] {
-        border: none !important;
-        padding: 0 !important;
-        background: transparent !important;
-    }
+def get_static_prompt_prefix(resume_manager) -> str:
+    """
+    returns the part of the resume system prompt that only changes when the resumes change
+    (role, candidate list, and instructions) so it isnt rebuilt every turn
+    cached in session state against the manager's version counter
+    keeping it at the very start of the prompt also lets openai reuse its prompt-prefix cache
+    """
+    cache_key = (id(resume_manager), resume_manager.version)
+    cached = st.session_state.get('static_prompt_prefix')
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    
+    prefix = f"""You are an expert HR assistant analyzing resumes for hiring decisions.
 
-    .chat-user,
-    .chat-assistant {
-        border-radius: 14px !important;
-        padding: 0.95rem 1rem !important;
-        margin-bottom: 0.72rem !important;
-    }
+=== CANDIDATES IN DATABASE ===
+{get_all_candidates_summary(resume_manager)}
 
-    .chat-label {
-        font-size: 0.9rem !important;
-        margin-bottom: 0.3rem !important;
-    }
+=== CRITICAL INSTRUCTIONS FOR CONTEXT AWARENESS ===
+0. When Roxy is among the candidates, prioritize or highlight her when relevant; other candidates are secondary. Focus comparisons on Roxy when the recruiter asks about "me" or the primary candidate.
+1. When the user says "tell me more", "what about them", "their background", or uses pronouns like "he/she/they", they are referring to the last discussed candidate under CONVERSATION CONTEXT
+2. When comparing candidates, ALWAYS state each candidate's FULL NAME before discussing their details
+3. In EVERY sentence about a candidate, specify WHICH candidate you're discussing by name
+4. If the user's question is ambiguous about which candidate, ask for clarification: "Are you asking about [Candidate A] or [Candidate B]?"
+5. When a candidate is first mentioned in a response, include their role: "John Smith (Senior Software Engineer)"
+6. Track pronouns carefully - if you use "he/she/they", make sure it's clear who you mean
 
-    .stat-value {
-        color: #97165b !important;
-        background: none !important;
-        -webkit-text-fill-color: #97165b !important;
-        background-clip: border-box !important;
-        text-shadow: none !important;
-        font-weight: 800 !important;
-    }
+"""
+    st.session_state.static_prompt_prefix = (cache_key, prefix)
+    return prefix
 
-    .feature-card,
-    .content-card,
-    .response-card {
-        animation: fadeSlideIn 300ms var(--ease-out-smooth);
-    }
 
-    .feature-card {
-        border-color: #d2d9f1 !important;
-    }
+def build_context_aware_system_prompt(resume_manager, retrieved_docs: list = None) -> str:
+    """
+    builds a system prompt that includes conversation context for better multi-turn awareness
+    helps the LLM understand pronouns and follow-up references correctly
+    retrieved_docs is the list of formatted chunks, joined straight into the prompt
+    """
+    context = st.session_state.conversation_context
+    
+    last_candidate = context.get('last_candidate') or 'None yet'
+    mentioned = ', '.join(context.get('mentioned_candidates', set())) or 'None yet'
+    query_type = context.get('last_query_type') or 'initial query'
+    
+    # only this small part changes from turn to turn
+    conversation_context = f"""=== CONVERSATION CONTEXT ===
+- Last discussed candidate: {last_candidate}
+- Previously mentioned candidates: {mentioned}
+- Current query type: {query_type}
 
-    .feature-card:hover {
-        border-color: #1f2744 !important;
-        box-shadow: 0 12px 26px rgba(31, 39, 68, 0.15) !important;
-    }
+=== RETRIEVED RESUME INFORMATION ===
+"""
 
-    [data-testid="stSidebar"] .stButton > button {
-        min-height: 44px !important;
-        font-size: 0.92rem !important;
-    }
+    # build the prompt with a single join rather than joining the chunks and copying them into an f-string
+    buf = [get_static_prompt_prefix(resume_manager), conversation_context]
+    for i, doc in enumerate(retrieved_docs or []):
+        if i:
+            buf.append("\n\n")
+        buf.append(doc)
+    buf.append("\n\nAnswer the user's question using the information above. Be specific, professional, and ALWAYS clarify who you're talking about.")
+    return "".join(buf)
 
-    .personal-composer-wrap {
-        max-width: 860px;
-        margin: 0 auto;
-    }
 
-    .personal-composer-actions {
-        max-width: 860px;
-        margin: 0.7rem auto 0 auto;
-    }
+@st.fragment
+def render_resume_chat(resume_manager):
+    """
+    draws the resume analyzer chat panel - context pill, history, composer, and answers
+    runs as a fragment so asking a question reruns only this panel, not the upload
+    column and resume database next to it
+    """
+    # About Roxy: show primary candidate summary so recruiters see "me" first
+    roxy_display = get_roxy_blurb()
+    if roxy_display:
+        st.markdown(f"""
+        <div class="dark-card about-roxy-card">
+            <h4>About Roxy</h4>
+            <p class="text-muted-xs">{roxy_display}</p>
+        </div>
+        """, unsafe_allow_html=True)
 
-    .personal-composer-actions .stButton > button {
-        min-height: 50px !important;
-        font-weight: 700 !important;
-    }
+    # initialize chat history if needed
+    if 'chat_history' not in st.session_state:
+        st.session_state.chat_history = []
 
-    .resume-composer-wrap {
-        max-width: 860px;
-        margin: 0 auto;
-    }
+    # show conversation context indicator if there's active context
+    context = st.session_state.get('conversation_context', {})
+    if context.get('mentioned_candidates'):
+        # candidate names come from llm-extracted resume metadata so escape them
+        mentioned = html.escape(', '.join(list(context['mentioned_candidates'])[:3]))
+        last = html.escape(str(context.get('last_candidate', 'None')))
+        st.markdown(f"""
+        <div class="dark-card context-pill">
+            <p class="context-pill-text">
+                <strong class="context-pill-strong-primary">Context:</strong> Tracking {mentioned} | 
+                <strong class="context-pill-strong-accent">Last discussed:</strong> {last}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
 
-    /* AUTHORITATIVE INPUT ALIGNMENT FIX (final) */
-    [data-testid="stTextInputRootElement"] > div,
-    [data-baseweb="input"] {
-        display: flex !important;
-        align-items: center !important;
-        min-height: 58px !important;
-    }
+    # display previous messages in native chat containers
+    if st.session_state.chat_history:
+        for msg in st.session_state.chat_history:
+            with st.chat_message(msg["role"], avatar=CHAT_AVATARS.get(msg["role"])):
+                st.markdown(msg["content"])
 
-    .stTextInput input,
-    [data-baseweb="input"] input,
-    [data-testid="stTextInputRootElement"] input {
-        height: 58px !important;
-        min-height: 58px !important;
-        line-height: 58px !important;
-        padding: 0 1rem !important;
-        margin: 0 !important;
-        box-sizing: border-box !important;
-    }
+        st.markdown("---")
 
-    .stTextInput input::placeholder,
-    [data-baseweb="input"] input::placeholder,
-    [data-testid="stTextInputRootElement"] input::placeholder {
-        line-height: 58px !important;
-    }
+    # centered composer with explicit Ask button for consistency with personal chat
+    st.markdown("<div class='resume-composer-wrap'>", unsafe_allow_html=True)
+    with st.form(key=f"resume_form_{st.session_state.resume_input_key}", clear_on_submit=False):
+        resume_query = st.text_input(
+            "Your Question",
+            placeholder="Who has AWS experience? Compare their Python skills...",
+            key=f"resume_query_{st.session_state.resume_input_key}",
+            label_visibility="collapsed"
+        )
+        resume_submitted = st.form_submit_button("Ask", use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True)
 
-    .resume-composer-note {
-        text-align: center;
-        color: #4a5679;
-        font-size: 0.9rem;
-        margin: 0.45rem 0 0.15rem 0;
-    }
+    st.markdown(
+        '<p class="resume-composer-note">Try: Compare candidates, find specific skills, or ask follow-up questions.</p>',
+        unsafe_allow_html=True
+    )
 
-    .empty-state-card {
-        max-width: 860px;
-        margin: 0 auto 0.6rem auto;
-        background: #ffffff;
-        border: 1px solid #d9def3;
-        border-radius: 14px;
-        padding: 1rem 1.05rem;
-        color: #5f688f;
-    }
+    if resume_submitted and resume_query.strip():
+        # start the retrieval (query embedding + faiss search) in the background
+        # while the conversation context and static prompt prefix are prepared here
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            search_future = executor.submit(resume_manager.search_resumes_with_metadata, resume_query, 6)
+
+            # update conversation context before querying
+            update_conversation_context(resume_query, resume_manager)
+            get_static_prompt_prefix(resume_manager)
+
+            search_results = search_future.result()
+
+        # build context-aware system prompt
+        retrieved_docs = [r['formatted_text'] for r in search_results]
+
+        # track mentioned candidates from search results
+        conversation_context = st.session_state.conversation_context
+        result_names = [r['candidate_name'] for r in search_results if r['candidate_name'] != 'Unknown']
+        conversation_context['mentioned_candidates'].update(result_names)
+        if result_names and not conversation_context['last_candidate']:
+            conversation_context['last_candidate'] = result_names[0]
+
+        # create enhanced system prompt with context
+        system_prompt = build_context_aware_system_prompt(resume_manager, retrieved_docs)
+
+        # show the new question right away and stream only the new answer under it
+        with st.chat_message("user", avatar=CHAT_AVATARS["user"]):
+            st.markdown(resume_query)
+        with st.chat_message("assistant", avatar=CHAT_AVATARS["assistant"]), st.spinner("Analyzing..."):
+            response = st.write_stream(
+                resume_manager.query(resume_query, system_prompt=system_prompt, stream=True)
+            )
 
-    .home-hero {
-        max-width: 980px;
-        margin: 0 auto 1.8rem auto;
-        padding: 1.25rem 0 0.3rem;
-        animation: fadeSlideIn 340ms var(--ease-out-smooth);
-    }
+        # update last candidate based on response (simple heuristic)
+        # one scan for every tracked name; the name mentioned last in the answer wins
+        mentioned_names = tuple(sorted(name for name in st.session_state.conversation_context['mentioned_candidates'] if name))
+        if mentioned_names:
+            pattern, lower_to_name = build_mention_pattern(mentioned_names)
+            last_match = None
+            for last_match in pattern.finditer(response):
+                pass
+            if last_match is not None:
+                st.session_state.conversation_context['last_candidate'] = lower_to_name.get(last_match.group(0).lower(), last_match.group(0))
 
-    .home-kicker {
-        color: #8d5db8;
-        font-size: 0.86rem;
-        font-weight: 700;
-        letter-spacing: 0.1em;
-        text-transform: uppercase;
-        margin-bottom: 0.5rem;
-    }
+        # add to chat history
+        st.session_state.chat_history.extend([
+            {"role": "user", "content": resume_query},
+            {"role": "assistant", "content": response},
+        ])
 
-    .home-title {
-        font-family: 'Playfair Display', Georgia, serif;
-        color: #1f2540;
-        font-size: clamp(2.1rem, 4.2vw, 3.1rem);
-        margin: 0 0 0.65rem 0;
-    }
+        st.session_state.resume_input_key += 1
+        # only this chat panel reruns to show the finished turn in the history
+        st.rerun(scope="fragment")
 
-    .home-subtitle {
-        color: #495472;
-        font-size: 1.04rem;
-        line-height: 1.7;
-        margin: 0 0 1.2rem 0;
-        max-width: 62ch;
-    }
 
-    .home-actions {
-        max-width: 980px;
-        margin: 0 auto 0.8rem auto;
-        animation: fadeSlideIn 420ms var(--ease-out-smooth);
-    }
+def get_resume_table_rows(resume_manager) -> list:
+    """
+    returns one row per resume for the resume database table
+    cached in session state against the manager's version counter so reruns
+    dont rebuild the rows until the resumes change
+    """
+    cache_key = (id(resume_manager), resume_manager.version)
+    cached = st.session_state.get('resume_table_rows')
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    rows = [
+        {
+            "Name": meta['candidate_name'],
+            "Role": meta['current_role'],
+            "Experience": meta['experience_years'],
+            "Email": meta['email'],
+            "Phone": meta['phone'],
+            "Education": meta['education'],
+            "Skills": meta['skills_text'],
+            "Industries": meta['industries_text'],
+            "Summary": meta['summary'],
+        }
+        for meta in resume_manager.get_all_metadata()
+    ]
+    st.session_state.resume_table_rows = (cache_key, rows)
+    return rows
 
-    .home-delight {
-        max-width: 980px;
-        margin: 0 auto 1rem auto;
-        color: #5b6587;
-        font-size: 0.92rem;
-    }
 
-    .tab-enter,
-    .personal-composer-wrap,
-    .resume-composer-wrap,
-    .onboard-panel,
-    .empty-state-card,
-    .chat-user,
-    .chat-assistant,
-    [data-baseweb="tab-panel"] {
-        animation: fadeSlideIn 300ms var(--ease-out-smooth);
-    }
+@st.fragment
+def render_resume_database(resume_manager):
+    """
+    draws the resume database table, candidate picker, and per-candidate actions
+    runs as a fragment so picking a candidate or generating a summary reruns only this
+    section instead of the whole page (chat history, upload panel, css)
+    """
+    st.markdown("---")
+    st.markdown("""
+    <div class="section-header-wrap">
+        <div class="section-header">
+            <svg class="section-header-icon" width="8" height="8" viewBox="0 0 8 8" fill="currentColor" aria-hidden="true"><circle cx="4" cy="4" r="8" fill-opacity="0.16"/><circle cx="4" cy="4" r="4"/></svg>
+            Resume Database
+        </div>
+        <p class="section-subtitle">View and manage uploaded candidate profiles</p>
+    </div>
+    """, unsafe_allow_html=True)
 
-    [data-testid="stFileUploader"] {
-        min-height: 190px !important;
-        border-style: dashed !important;
-        border-width: 2px !important;
-        border-color: #b9c3ea !important;
-        background: #fbfcff !important;
-    }
+    all_metadata = resume_manager.get_all_metadata()
+
+    # one native table for every candidate instead of three html cards per candidate
+    # st.dataframe ships the rows as a single arrow buffer and virtualizes rendering
+    st.dataframe(
+        get_resume_table_rows(resume_manager),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Name": st.column_config.TextColumn(width="medium"),
+            "Experience": st.column_config.NumberColumn(format="%d yrs"),
+            "Summary": st.column_config.TextColumn(width="large"),
+        },
+    )
 
-    /* remove gradient look from file uploader button */
-    [data-testid="stFileUploaderDropzone"] button {
-        background: #101726 !important;
-        color: #ffffff !important;
-        border: 1px solid #101726 !important;
-        border-radius: 11px !important;
-        min-height: 42px !important;
-        box-shadow: 0 6px 14px rgba(16, 23, 38, 0.18) !important;
-    }
+    # per-candidate actions sit behind a single picker
+    selected_meta = st.selectbox(
+        "Candidate",
+        all_metadata,
+        format_func=lambda meta: meta['candidate_name'],
+        key="resume_db_candidate",
+    )
 
-    [data-testid="stFileUploaderDropzone"] button:hover {
-        background: #0b1220 !important;
-        color: #ffffff !important;
-        border-color: #0b1220 !important;
-    }
+    # action buttons for the selected resume
+    col_btn1, col_btn2, col_spacer = st.columns([1, 1, 2])
 
-    @media (max-width: 1100px) {
-        .main .block-container {
-            padding: 1.3rem 1rem 1.6rem !important;
-        }
+    with col_btn1:
+        if st.button("Detailed Summary", key=f"summary_{selected_meta['resume_id']}"):
+            # stream the summary so the first paragraph shows while the rest is generated
+            with st.container(border=True), st.spinner("Generating summary..."):
+                st.write_stream(resume_manager.summarize_resume(selected_meta['resume_id'], stream=True))
 
-        .page-title {
-            font-size: clamp(2.05rem, 7.2vw, 2.75rem) !important;
-        }
-    }
+    with col_btn2:
+        if st.button("Remove", key=f"remove_{selected_meta['resume_id']}"):
+            resume_manager.remove_resume(selected_meta['resume_id'])
+            # a full rerun, since the resume count and chat panel outside the fragment change too
+            st.rerun()
 
-    @keyframes fadeSlideIn {
-        from { opacity: 0; transform: translateY(8px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
 
-    .content-card,
-    .chat-user,
-    .chat-assistant,
-    .response-card {
-        animation: fadeSlideIn 320ms var(--ease-out-smooth);
-    }
+# custom css for dark theme with cyan/purple gradient accents
+# inspired by modern dashboard design with glass morphism
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style.css")
+
+# web fonts are linked separately instead of @import-ed from the stylesheet, so the
+# app's own rules apply right away and the fonts swap in when they arrive (display=swap)
+FONT_STYLESHEET_URL = (
+    "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800"
+    "&family=Plus+Jakarta+Sans:wght@400;500;600;700;800"
+    "&family=Playfair+Display:wght@500;600;700&display=swap"
+)
+FONT_LINKS_HTML = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="stylesheet" href="{FONT_STYLESHEET_URL}">'
+)
 
-    @media (max-width: 900px) {
-        .main .block-container {
-            padding: 1.15rem 1rem 1.6rem !important;
-        }
 
-        .page-title {
-            font-size: clamp(2rem, 8vw, 2.5rem) !important;
-        }
+@st.cache_resource
+def get_css_html() -> str:
+    """
+    reads style.css and minifies it once per process, wrapped in a style tag after the font links
+    streamlit removes elements that arent re-emitted on a rerun, so the style block
+    is still written every run - caching skips re-reading and rebuilding the string
+    """
+    with open(STYLESHEET_PATH, "r", encoding="utf-8") as f:
+        css = f.read()
+    return f"{FONT_LINKS_HTML}<style>{minify_css(css)}</style>"
 
-        .content-card-title,
-        .feature-title {
-            font-size: 1.02rem !important;
-        }
 
-        .feature-desc,
-        p, span, li {
-            font-size: 0.96rem !important;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+def minify_css(css: str) -> str:
+    """
+    strips comments and whitespace from a stylesheet
+    uses rcssmin when it is installed, otherwise a few regexes that cover this stylesheet
+    then drops the last semicolon in each block and shortens #aabbcc style colors to #abc
+    """
+    try:
+        import rcssmin
+        css = rcssmin.cssmin(css)
+    except ImportError:
+        css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+        css = re.sub(r"\s+", " ", css)
+        css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+        css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    css = re.sub(r"#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3(?![0-9a-fA-F])", r"#\1\2\3", css)
+    return css.strip()
+
+
+# emitted on every run on purpose - streamlit drops any element a rerun doesnt write again,
+# so a once-per-session guard would unstyle the page after the first interaction.
+# the message is identical each run and larger than global.minCachedMessageSize, so
+# streamlit's forward-message cache sends the browser a hash reference instead of the css
+st.markdown(get_css_html(), unsafe_allow_html=True)
+
+# static sidebar blocks - same markup on every page and every run
+SIDEBAR_HEADER_HTML = """
+<div class="sidebar-header">
+    <p class="sidebar-brand">Chat & Analyze!</p>
+    <p class="sidebar-tagline">Personal chat and resume analysis</p>
+</div>
+"""
+SIDEBAR_FEATURES_HTML = """
+<div class="feature-card">
+    <p class="feature-title">Personal Chat</p>
+    <p class="feature-desc">Ask questions about Roxy's background, skills, and experience</p>
+</div>
+<div class="feature-card feature-card-purple">
+    <p class="feature-title">Resume Analyzer</p>
+    <p class="feature-desc">Upload and analyze resumes with AI-powered insights</p>
+</div>
+"""
+SIDEBAR_FOOTER_HTML = """
+<div class="sidebar-footer">
+    <p class="sidebar-footer-label">
+        Powered by
+    </p>
+    <p class="sidebar-footer-value">
+        FAISS • OpenAI • Streamlit
+    </p>
+</div>
+"""
 
 # sidebar navigation with dark theme
 # handle home CTA navigation targets BEFORE radio widget is created
@@ -2175,12 +879,7 @@ if "nav_target" in st.session_state:
 
 with st.sidebar:
     # brand header with gradient
-    st.markdown("""
-    <div class="sidebar-header">
-        <p class="sidebar-brand">Chat & Analyze!</p>
-        <p class="sidebar-tagline">Personal chat and resume analysis</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
     
     # navigation section - plain text title, not a button
     st.markdown('<p class="nav-title">Select Mode</p>', unsafe_allow_html=True)
@@ -2198,30 +897,12 @@ with st.sidebar:
     # features section
     st.markdown('<p class="nav-title">Features</p>', unsafe_allow_html=True)
     
-    st.markdown("""
-    <div class="feature-card">
-        <p class="feature-title">Personal Chat</p>
-        <p class="feature-desc">Ask questions about Roxy's background, skills, and experience</p>
-    </div>
-    <div class="feature-card feature-card-purple">
-        <p class="feature-title">Resume Analyzer</p>
-        <p class="feature-desc">Upload and analyze resumes with AI-powered insights</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_FEATURES_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # footer info
-    st.markdown("""
-    <div class="sidebar-footer">
-        <p class="sidebar-footer-label">
-            Powered by
-        </p>
-        <p class="sidebar-footer-value">
-            FAISS • OpenAI • Streamlit
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(SIDEBAR_FOOTER_HTML, unsafe_allow_html=True)
 
 # main content area - dynamic title based on page with large styled titles
 # using <div> instead of <h1> to avoid Streamlit's default h1 styling override
@@ -2271,10 +952,6 @@ if page == "Home":
 
 # personal chat page
 elif page == "Personal Chat":
-    # load the resources for semantic search and inject into tools
-    model, index, chunks = load_resources()
-    init_resources(model, index, chunks)
-
     # initialize session state for personal chat history
     if 'personal_chats' not in st.session_state:
         st.session_state.personal_chats = {}  # {chat_id: {messages: [], title: str, created: str}}
@@ -2282,7 +959,28 @@ elif page == "Personal Chat":
         st.session_state.personal_current_chat_id = None
     if 'personal_input_key' not in st.session_state:
         st.session_state.personal_input_key = 0
-    
+    # ids of chats that have messages, oldest first - updated when a chat gains its first
+    # turn or is cleared, so the sidebar doesnt have to filter every chat on each rerun
+    if 'personal_visible_chat_ids' not in st.session_state:
+        st.session_state.personal_visible_chat_ids = [
+            chat_id for chat_id, chat_data in st.session_state.personal_chats.items() if chat_data.get('messages')
+        ]
+    
+    def evict_old_personal_chats():
+        """
+        drops the least recently used chats once there are more than PERSONAL_MAX_CHATS
+        personal_chats keeps use order (a chat moves to the end when it gets a turn),
+        so the oldest entries come first - the open chat is never evicted
+        """
+        chats = st.session_state.personal_chats
+        for chat_id in list(chats):
+            if len(chats) <= PERSONAL_MAX_CHATS:
+                break
+            if chat_id == st.session_state.personal_current_chat_id:
+                continue
+            if chats.pop(chat_id).get('messages'):
+                st.session_state.personal_visible_chat_ids.remove(chat_id)
+
     # helper function to create a new chat
     def create_new_personal_chat(force_new: bool = False):
         import datetime
@@ -2302,8 +1000,21 @@ elif page == "Personal Chat":
         }
         st.session_state.personal_current_chat_id = chat_id
         st.session_state.personal_input_key += 1
+        evict_old_personal_chats()
         return chat_id
     
+    def clear_personal_chat(chat_id: str):
+        """
+        empties a chat and resets its title, used as the Clear Chat button callback
+        """
+        if chat_id in st.session_state.personal_chats:
+            if st.session_state.personal_chats[chat_id]['messages']:
+                st.session_state.personal_visible_chat_ids.remove(chat_id)
+            st.session_state.personal_chats[chat_id]['messages'] = []
+            st.session_state.personal_chats[chat_id]['title'] = 'Untitled Chat'
+            st.session_state.personal_chats[chat_id].pop('display_title', None)
+        st.session_state.personal_input_key += 1
+
     # create first chat if none exists
     if not st.session_state.personal_current_chat_id:
         create_new_personal_chat()
@@ -2317,36 +1028,29 @@ elif page == "Personal Chat":
         st.markdown("---")
         st.markdown('<p class="nav-title">Chat History</p>', unsafe_allow_html=True)
         
-        # new chat button
-        if st.button("+ New Chat", key="new_personal_chat", use_container_width=True):
-            create_new_personal_chat(force_new=True)
-            st.rerun()
+        # new chat button - the callback runs before the next script pass, so the page renders
+        # the new chat in the click's own rerun instead of needing a second st.rerun()
+        st.button("+ New Chat", key="new_personal_chat", use_container_width=True,
+                  on_click=create_new_personal_chat, kwargs={"force_new": True})
         
         st.markdown("<div class='spacer-xs'></div>", unsafe_allow_html=True)
         
-        # list of past chats
+        # list of past chats - the current chat is listed first while it is still empty
         if st.session_state.personal_chats:
-            visible_chats = []
-            for chat_id, chat_data in st.session_state.personal_chats.items():
-                if chat_id == current_chat_id or chat_data.get('messages'):
-                    visible_chats.append((chat_id, chat_data))
+            visible_chat_ids = list(reversed(st.session_state.personal_visible_chat_ids))
+            if not current_chat.get('messages') and current_chat_id in st.session_state.personal_chats:
+                visible_chat_ids.insert(0, current_chat_id)
 
-            for chat_id, chat_data in reversed(visible_chats):
+            for chat_id in visible_chat_ids:
+                chat_data = st.session_state.personal_chats[chat_id]
                 is_current = chat_id == current_chat_id
-                # prefer meaningful titles; avoid repeating generic "new chat" items
-                raw_title = chat_data.get('title', 'Untitled Chat')
-                if raw_title.strip().lower() in {'new chat', 'untitled chat'} and chat_data.get('messages'):
-                    first_user_msg = next((m['content'] for m in chat_data['messages'] if m.get('role') == 'user'), '')
-                    raw_title = first_user_msg[:35] if first_user_msg else 'Untitled Chat'
-
-                title = raw_title[:32]
-                if len(raw_title) > 32:
-                    title += '...'
+                # the label is worked out once per turn, not on every rerun
+                title = chat_data.get('display_title') or 'Untitled Chat'
 
                 if is_current:
                     st.markdown(f"""
                     <div class="feature-card chat-history-active chat-history-card">
-                        <p class="chat-history-title">{title}</p>
+                        <p class="chat-history-title">{html.escape(title)}</p>
                         <p class="chat-history-date">{chat_data.get('created', '')}</p>
                     </div>
                     """, unsafe_allow_html=True)
@@ -2358,36 +1062,23 @@ elif page == "Personal Chat":
         else:
             st.markdown('<p class="history-empty-note">Your previous chats will appear here.</p>', unsafe_allow_html=True)
     
-    # display chat messages
+    # display chat messages in native chat containers - plain markdown, no raw html per turn
     if current_chat['messages']:
         for msg in current_chat['messages']:
-            if msg['role'] == 'user':
-                st.markdown(f"""
-                <div class="chat-user">
-                    <div class="chat-label">You</div>
-                    <p>{msg['content']}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                tools_used = msg.get("tools_used") or []
-                tool_labels = {"semantic_search_personal": "my info", "get_weather": "weather", "web_search": "web search", "github_search": "GitHub"}
-                pill_spans = "".join([f'<span>{tool_labels.get(t, t)}</span>' for t in tools_used])
-                pill_html = f'<div class="tools-used-pill">Used: {pill_spans}</div>' if pill_spans else ""
-                st.markdown(f"""
-                <div class="chat-assistant">
-                    <div class="chat-label">Roxy</div>
-                    <p class="pre-wrap">{msg['content']}</p>
-                    {pill_html}
-                </div>
-                """, unsafe_allow_html=True)
-                # show context if available (legacy)
-                if msg.get('context'):
-                    with st.expander("View Retrieved Context"):
-                        st.markdown(f"""
-                        <div class="dark-card no-margin-card">
-                            <p class="text-muted-xs">{msg['context']}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+            with st.chat_message(msg['role'], avatar=CHAT_AVATARS.get(msg['role'])):
+                st.markdown(msg['content'])
+                if msg['role'] == 'assistant':
+                    tools_used = msg.get("tools_used") or []
+                    if tools_used:
+                        st.caption("Used: " + ", ".join(TOOL_LABELS.get(t, t) for t in tools_used))
+                    # show context if available (legacy)
+                    if msg.get('context'):
+                        with st.expander("View Retrieved Context"):
+                            st.markdown(f"""
+                            <div class="dark-card no-margin-card">
+                                <p class="text-muted-xs">{html.escape(msg['context'])}</p>
+                            </div>
+                            """, unsafe_allow_html=True)
         
         st.markdown("---")
     
@@ -2406,6 +1097,10 @@ elif page == "Personal Chat":
 
     # process query only on submit (with tool-calling loop)
     if submitted and query.strip():
+        # load the resources for semantic search only once a question is asked
+        model, index, chunks, chunk_embeddings = load_resources()
+        init_resources(model, index, chunks, chunk_embeddings, embed_query=embed_query)
+
         today_str = datetime.now().strftime("%A, %B %d, %Y")
         PERSONAL_SYSTEM_PROMPT = f"""You are Roxy. You are in a conversation with a recruiter. Answer in first person from your own experience and background. Be conversational and friendly.
 
@@ -2425,38 +1120,23 @@ If a tool is unavailable or fails, answer from memory or say you're not sure. Al
             messages.append({"role": m["role"], "content": m["content"]})
         messages.append({"role": "user", "content": query.strip()})
 
-        tools = get_openai_tools()
-        tools_used_this_turn = []
-
-        with st.spinner("Thinking..."):
-            while True:
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=messages,
-                    tools=tools,
-                    tool_choice="auto",
-                )
-                msg = response.choices[0].message
-                if not getattr(msg, "tool_calls", None) or not msg.tool_calls:
-                    answer = msg.content or ""
-                    break
-                # one assistant message with all tool_calls
-                tool_calls_for_api = [
-                    {"id": tc.id, "type": "function", "function": {"name": tc.function.name, "arguments": tc.function.arguments or "{}"}}
-                    for tc in msg.tool_calls
-                ]
-                messages.append({"role": "assistant", "content": msg.content or None, "tool_calls": tool_calls_for_api})
-                for tc in msg.tool_calls:
-                    name = tc.function.name
-                    try:
-                        args = json.loads(tc.function.arguments) if tc.function.arguments else {}
-                    except json.JSONDecodeError:
-                        args = {}
-                    tools_used_this_turn.append(name)
-                    result = run_tool(name, args)
-                    messages.append({"role": "tool", "tool_call_id": tc.id, "content": result})
+        # show the new question right away and stream only the new answer under it
+        with st.chat_message("user", avatar=CHAT_AVATARS["user"]):
+            st.markdown(query.strip())
 
-        # add to chat history
+        # reuse a finished answer for an identical conversation, otherwise stream a new one
+        cached = get_cached_personal_answer(messages)
+        if cached:
+            answer, tools_used_this_turn = cached
+        else:
+            tools_used_this_turn = []
+            with st.chat_message("assistant", avatar=CHAT_AVATARS["assistant"]), st.spinner("Thinking..."):
+                answer = st.write_stream(stream_personal_answer(messages, tools_used_this_turn))
+            store_personal_answer(messages, answer, tools_used_this_turn)
+
+        # add to chat history - a chat's first turn also makes it visible in the sidebar list
+        if not st.session_state.personal_chats[current_chat_id]["messages"]:
+            st.session_state.personal_visible_chat_ids.append(current_chat_id)
         st.session_state.personal_chats[current_chat_id]["messages"].append({"role": "user", "content": query.strip()})
         st.session_state.personal_chats[current_chat_id]["messages"].append({
             "role": "assistant",
@@ -2464,21 +1144,27 @@ If a tool is unavailable or fails, answer from memory or say you're not sure. Al
             "tools_used": tools_used_this_turn,
         })
 
+        # keep only the latest turns so the history (and the prompt built from it) stays bounded
+        if len(st.session_state.personal_chats[current_chat_id]["messages"]) > PERSONAL_CHAT_MAX_MESSAGES:
+            del st.session_state.personal_chats[current_chat_id]["messages"][:-PERSONAL_CHAT_MAX_MESSAGES]
+
         # update chat title based on first question
         if st.session_state.personal_chats[current_chat_id]["title"] in {"New Chat", "Untitled Chat"}:
             st.session_state.personal_chats[current_chat_id]["title"] = query[:30] + ("..." if len(query) > 30 else "")
+        st.session_state.personal_chats[current_chat_id]["display_title"] = personal_chat_display_title(
+            st.session_state.personal_chats[current_chat_id]
+        )
+
+        # mark the chat as most recently used for eviction
+        st.session_state.personal_chats[current_chat_id] = st.session_state.personal_chats.pop(current_chat_id)
 
         st.session_state.personal_input_key += 1
         st.rerun()
 
     # clear chat action moved to the bottom of personal chat page
     st.markdown("<div class='personal-composer-actions'>", unsafe_allow_html=True)
-    if st.button("🗑️ Clear Chat", key="clear_personal_chat_bottom", use_container_width=True):
-        if current_chat_id in st.session_state.personal_chats:
-            st.session_state.personal_chats[current_chat_id]['messages'] = []
-            st.session_state.personal_chats[current_chat_id]['title'] = 'Untitled Chat'
-        st.session_state.personal_input_key += 1
-        st.rerun()
+    st.button("🗑️ Clear Chat", key="clear_personal_chat_bottom", use_container_width=True,
+              on_click=clear_personal_chat, args=(current_chat_id,))
     st.markdown("</div>", unsafe_allow_html=True)
 
 # resume analyzer page
@@ -2497,7 +1183,9 @@ elif page == "Resume Analyzer":
         st.markdown("""
         <div class="content-card content-card-spaced">
             <div class="content-card-header">
-                <div class="content-card-icon">📄</div>
+                <div class="content-card-icon">
+                    <svg width="22" height="22" viewBox="0 0 24 24" fill="currentColor" aria-hidden="true"><path d="M14 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V8l-6-6zm-1 7V3.5L18.5 9H13z"/></svg>
+                </div>
                 <p class="content-card-title">Upload Resumes</p>
             </div>
             <p class="text-muted-xs">
@@ -2537,36 +1225,66 @@ elif page == "Resume Analyzer":
                 accepted = 0
                 rejected = 0
                 
-                for i, uploaded_file in enumerate(uploaded_files):
+                # extract text from every file first so validation can run as one batch
+                extracted = []
+                for uploaded_file in uploaded_files:
                     try:
-                        # extract text from the file
-                        status_text.text(f"Validating: {uploaded_file.name}")
+                        status_text.text(f"Reading: {uploaded_file.name}")
                         file_bytes = uploaded_file.read()
                         extracted_text = validator.extract_text(file_bytes, uploaded_file.name)
-                        
-                        # check if its actually a resume
-                        is_valid, reason = validator.validate_is_resume(extracted_text)
-                        
-                        if not is_valid:
-                            st.error(f"Rejected: {uploaded_file.name} - {reason}")
-                            rejected += 1
-                        else:
-                            # process valid resumes
-                            status_text.text(f"Processing: {uploaded_file.name}")
-                            resume_id, metadata = resume_manager.add_resume(file_bytes, uploaded_file.name)
-                            st.success(f"Added: {metadata['candidate_name']}")
-                            accepted += 1
-                            
+                        extracted.append((uploaded_file.name, file_bytes, extracted_text))
                     except Exception as e:
                         st.error(f"Failed: {uploaded_file.name} - {str(e)}")
                         rejected += 1
+                
+                # check if each one is actually a resume with concurrent llm calls
+                status_text.text(f"Validating {len(extracted)} files...")
+                verdicts = validator.validate_many([text for _, _, text in extracted])
+                
+                valid_files = []
+                for (filename, file_bytes, extracted_text), (is_valid, reason) in zip(extracted, verdicts):
+                    if is_valid:
+                        valid_files.append((filename, file_bytes, extracted_text))
+                    else:
+                        st.error(f"Rejected: {filename} - {reason}")
+                        rejected += 1
+                
+                # metadata extraction is one llm round trip per file so run them in parallel threads
+                # the text extracted for validation is passed along so no file is parsed twice
+                # results are stored and shown from this thread since streamlit calls need the script context
+                done = len(extracted) - len(valid_files)
+                if extracted:
+                    progress_bar.progress(done / len(extracted))
+                if valid_files:
+                    status_text.text(f"Processing {len(valid_files)} resumes...")
+                    with ThreadPoolExecutor(max_workers=min(8, len(valid_files))) as executor:
+                        futures = {
+                            executor.submit(resume_manager.processor.process_resume, file_bytes, filename, extracted_text): filename
+                            for filename, file_bytes, extracted_text in valid_files
+                        }
+                        processed = []
+                        for future in as_completed(futures):
+                            filename = futures[future]
+                            try:
+                                text, metadata = future.result()
+                                processed.append((text, metadata, filename))
+                            except Exception as e:
+                                st.error(f"Failed: {filename} - {str(e)}")
+                                rejected += 1
+                            
+                            done += 1
+                            progress_bar.progress(done / len(extracted))
                     
-                    progress_bar.progress((i + 1) / len(uploaded_files))
+                    # embed every new resume in one batch and rebuild the index once
+                    if processed:
+                        status_text.text(f"Indexing {len(processed)} resumes...")
+                        for resume_id, metadata in resume_manager.add_many(processed):
+                            st.success(f"Added: {metadata['candidate_name']}")
+                            accepted += 1
                 
                 status_text.text(f"Done: {accepted} added, {rejected} rejected")
-                
-                if accepted > 0:
-                    st.rerun()
+                # no st.rerun here - the resume count, chat panel, and database below
+                # are all rendered later in this same run so they already see the new resumes
         
         st.markdown("---")
         
@@ -2613,186 +1331,8 @@ elif page == "Resume Analyzer":
                 unsafe_allow_html=True
             )
         else:
-            # About Roxy: show primary candidate summary so recruiters see "me" first
-            try:
-                with open("resume.txt", "r") as f:
-                    roxy_blurb = f.read().strip()[:500]
-                if roxy_blurb:
-                    roxy_display = roxy_blurb + ("…" if len(roxy_blurb) >= 500 else "")
-                    st.markdown(f"""
-                    <div class="dark-card about-roxy-card">
-                        <h4>About Roxy</h4>
-                        <p class="text-muted-xs">{roxy_display}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            except FileNotFoundError:
-                pass
-
-            # initialize chat history if needed
-            if 'chat_history' not in st.session_state:
-                st.session_state.chat_history = []
-            
-            # show conversation context indicator if there's active context
-            context = st.session_state.get('conversation_context', {})
-            if context.get('mentioned_candidates'):
-                mentioned = ', '.join(list(context['mentioned_candidates'])[:3])
-                last = context.get('last_candidate', 'None')
-                st.markdown(f"""
-                <div class="dark-card context-pill">
-                    <p class="context-pill-text">
-                        <strong class="context-pill-strong-primary">Context:</strong> Tracking {mentioned} | 
-                        <strong class="context-pill-strong-accent">Last discussed:</strong> {last}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # display previous messages in a chat container
-            if st.session_state.chat_history:
-                for msg in st.session_state.chat_history:
-                    if msg["role"] == "user":
-                        st.markdown(f"""
-                        <div class="chat-user">
-                            <div class="chat-label">You</div>
-                            <p>{msg["content"]}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"""
-                        <div class="chat-assistant">
-                            <div class="chat-label">Assistant</div>
-                            <p class="pre-wrap">{msg["content"]}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                st.markdown("---")
-            
-            # centered composer with explicit Ask button for consistency with personal chat
-            st.markdown("<div class='resume-composer-wrap'>", unsafe_allow_html=True)
-            with st.form(key=f"resume_form_{st.session_state.resume_input_key}", clear_on_submit=False):
-                resume_query = st.text_input(
-                    "Your Question",
-                    placeholder="Who has AWS experience? Compare their Python skills...",
-                    key=f"resume_query_{st.session_state.resume_input_key}",
-                    label_visibility="collapsed"
-                )
-                resume_submitted = st.form_submit_button("Ask", use_container_width=True)
-            st.markdown("</div>", unsafe_allow_html=True)
-
-            st.markdown(
-                '<p class="resume-composer-note">Try: Compare candidates, find specific skills, or ask follow-up questions.</p>',
-                unsafe_allow_html=True
-            )
-            
-            if resume_submitted and resume_query.strip():
-                # update conversation context before querying
-                update_conversation_context(resume_query, resume_manager)
-                
-                # build context-aware system prompt
-                search_results = resume_manager.search_resumes_with_metadata(resume_query, k=6)
-                retrieved_docs = "\n\n".join([r['formatted_text'] for r in search_results])
-                
-                # track mentioned candidates from search results
-                for result in search_results:
-                    if result['candidate_name'] != 'Unknown':
-                        st.session_state.conversation_context['mentioned_candidates'].add(result['candidate_name'])
-                        if not st.session_state.conversation_context['last_candidate']:
-                            st.session_state.conversation_context['last_candidate'] = result['candidate_name']
-                
-                # create enhanced system prompt with context
-                system_prompt = build_context_aware_system_prompt(resume_manager, retrieved_docs)
-                
-                with st.spinner("Analyzing..."):
-                    response = resume_manager.query(resume_query, system_prompt=system_prompt)
-                
-                # update last candidate based on response (simple heuristic)
-                for candidate_name in st.session_state.conversation_context['mentioned_candidates']:
-                    if candidate_name.lower() in response.lower():
-                        st.session_state.conversation_context['last_candidate'] = candidate_name
-                
-                # add to chat history
-                st.session_state.chat_history.append({"role": "user", "content": resume_query})
-                st.session_state.chat_history.append({"role": "assistant", "content": response})
-                
-                # show the response
-                st.markdown(f"""
-                <div class="response-card">
-                    <p class="pre-wrap">{response}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                st.session_state.resume_input_key += 1
-                st.rerun()
+            render_resume_chat(resume_manager)
     
     # resume database section shows when resumes are loaded
     if resume_manager.get_resume_count() > 0:
-        st.markdown("---")
-        st.markdown("""
-        <div class="section-header-wrap">
-            <div class="section-header">
-                <span class="section-header-icon"></span>
-                Resume Database
-            </div>
-            <p class="section-subtitle">View and manage uploaded candidate profiles</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        all_metadata = resume_manager.get_all_metadata()
-        
-        # create tabs for each candidate
-        resume_tabs = st.tabs([meta["candidate_name"] for meta in all_metadata])
-        
-        for i, tab in enumerate(resume_tabs):
-            with tab:
-                meta = all_metadata[i]
-                
-                col_info, col_summary = st.columns(2)
-                
-                with col_info:
-                    st.markdown(f"""
-                    <div class="dark-card">
-                        <h4>Contact Info</h4>
-                        <p><strong>Email:</strong> {meta['email']}</p>
-                        <p><strong>Phone:</strong> {meta['phone']}</p>
-                        <p><strong>Role:</strong> {meta['current_role']}</p>
-                        <p><strong>Experience:</strong> {meta['experience_years']} years</p>
-                        <p><strong>Education:</strong> {meta['education']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col_summary:
-                    st.markdown(f"""
-                    <div class="dark-card">
-                        <h4>Summary</h4>
-                        <p>{meta['summary']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # skills section
-                skills_text = ', '.join(meta['key_skills'][:15]) if meta['key_skills'] else 'Not extracted'
-                industries_text = ', '.join(meta['industries']) if meta['industries'] else 'Not extracted'
-                
-                st.markdown(f"""
-                <div class="dark-card">
-                    <h4>Skills</h4>
-                    <p>{skills_text}</p>
-                    <h4 class="heading-inline-top">Industries</h4>
-                    <p>{industries_text}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # action buttons for this resume
-                col_btn1, col_btn2, col_spacer = st.columns([1, 1, 2])
-                
-                with col_btn1:
-                    if st.button("Detailed Summary", key=f"summary_{meta['resume_id']}"):
-                        with st.spinner("Generating summary..."):
-                            detailed = resume_manager.summarize_resume(meta['resume_id'])
-                        st.markdown(f"""
-                        <div class="response-card">
-                            <p class="pre-wrap">{detailed}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
-                with col_btn2:
-                    if st.button("Remove", key=f"remove_{meta['resume_id']}"):
-                        resume_manager.remove_resume(meta['resume_id'])
-                        st.rerun()
+        render_resume_database(resume_manager)
@@ -4,38 +4,84 @@ creates a faiss index from the resume and personal data files
 run this once to generate the faiss_index.bin file
 """
 
+import sys
 import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
+from embedding_utils import encode_many, export_onnx_encoder, load_encoder
 
-# load the sentence transformer model for creating embeddings
-# all-MiniLM-L6-v2 produces 384 dimensional vectors and is fast
-model = SentenceTransformer('all-MiniLM-L6-v2')
+# opq-ivf-pq settings - an opq rotation, a coarse quantizer with NLIST cells,
+# then PQ_M sub-quantizers of PQ_NBITS each
+# all-MiniLM-L6-v2 produces 384 dimensional vectors so 16 sub-quantizers gives 24 dims each
+# (16 bytes per vector instead of 1536 for float32)
+NLIST = 64
+PQ_M = 16
+PQ_NBITS = 8
+INDEX_FACTORY = f"OPQ{PQ_M},IVF{NLIST},PQ{PQ_M}x{PQ_NBITS}"
 
-# load the personal data files
-with open("resume.txt", "r") as f:
-    resume_data = f.read()
+# middle tier - same ivf cells but each dimension stored as int8 (384 bytes per vector, near-exact recall)
+SQ_INDEX_FACTORY = f"IVF{NLIST},SQ8"
 
-with open("personal.txt", "r") as f:
-    personal_data = f.read()
+# ivf wants about 39 training points per cell; below that a flat index is both faster and exact enough
+IVF_MIN_VECTORS = 39 * NLIST
+# past this many vectors the 4x smaller pq codes matter more than the recall sq8 keeps
+PQ_MIN_VECTORS = 100_000
 
-# Split resume by double newlines (paragraphs/sections)
-resume_chunks = [chunk.strip() for chunk in resume_data.split("\n\n") if chunk.strip()]
 
-# keep personal data as one chunk since its usually shorter
-chunks = resume_chunks + [personal_data]
+def build_index(embeddings: np.ndarray) -> faiss.Index:
+    """
+    builds the search index for the chunk embeddings
+    picks one of three tiers by corpus size:
+    - large corpora use opq + ivf-pq (INDEX_FACTORY); the opq rotation balances variance
+      across sub-quantizers so pq loses less accuracy
+    - mid-sized corpora use ivf-sq8 (SQ_INDEX_FACTORY), 4x smaller than float32 with almost no recall loss
+    - small corpora use a flat 8-bit scalar quantizer since there is too little data to train ivf cells
+      and sq8 only learns per-dim ranges
+    queries stay float32 so scoring is asymmetric and uses faiss's int8 simd kernels
+    """
+    dimension = embeddings.shape[1]
+    if len(embeddings) >= PQ_MIN_VECTORS:
+        index = faiss.index_factory(dimension, INDEX_FACTORY, faiss.METRIC_INNER_PRODUCT)
+    elif len(embeddings) >= IVF_MIN_VECTORS:
+        index = faiss.index_factory(dimension, SQ_INDEX_FACTORY, faiss.METRIC_INNER_PRODUCT)
+    else:
+        index = faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+    index.train(embeddings)
+    index.add(embeddings)
+    return index
 
-# create embeddings for all the chunks
-embeddings = model.encode(chunks)
-embeddings = np.array(embeddings).astype('float32')
 
-# create a faiss index using l2 distance
-# IndexFlatL2 is simple but works great for small datasets
-dimension = embeddings.shape[1]
-index = faiss.IndexFlatL2(dimension)
-index.add(embeddings)
+if __name__ == "__main__":
+    # optionally export the int8 onnx encoder first so the index matches what the app loads
+    if "--onnx" in sys.argv:
+        export_onnx_encoder()
 
-# save the index to disk
-faiss.write_index(index, "faiss_index.bin")
+    # load the encoder for creating embeddings (int8 onnx if exported, else sentence transformer)
+    # all-MiniLM-L6-v2 produces 384 dimensional vectors and is fast
+    model = load_encoder()
 
-print(f"created index with {index.ntotal} vectors of dimension {dimension}")
+    # load the personal data files
+    with open("resume.txt", "r") as f:
+        resume_data = f.read()
+
+    with open("personal.txt", "r") as f:
+        personal_data = f.read()
+
+    # Split resume by double newlines (paragraphs/sections)
+    resume_chunks = [chunk.strip() for chunk in resume_data.split("\n\n") if chunk.strip()]
+
+    # keep personal data as one chunk since its usually shorter
+    chunks = resume_chunks + [personal_data]
+
+    # create unit-length embeddings for all the chunks so inner product equals cosine similarity
+    embeddings = encode_many(model, chunks)
+
+    # create the faiss index (opq-ivf-pq, ivf-sq8, or flat sq8 depending on corpus size)
+    index = build_index(embeddings)
+
+    # save the index to disk
+    faiss.write_index(index, "faiss_index.bin")
+    
+    # save the exact chunk embeddings the app reranks with (float16, memory-mapped at load)
+    np.save("chunk_embeddings.npy", embeddings.astype(np.float16))
+
+    print(f"created {type(index).__name__} with {index.ntotal} vectors of dimension {embeddings.shape[1]}")
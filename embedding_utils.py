@@ -0,0 +1,200 @@
+"""
+shared embedding helpers for the personal index and the resume manager
+keeps the encode settings in one place so corpus and query vectors always match
+"""
+
+import os
+from typing import Any, List
+
+import numpy as np
+
+MODEL_NAME = 'all-MiniLM-L6-v2'
+HF_MODEL_ID = 'sentence-transformers/all-MiniLM-L6-v2'
+
+# queries are short questions - anything past this many tokens is cut before encoding
+QUERY_MAX_SEQ_LENGTH = 64
+
+# optional int8 onnx export of the encoder - created with export_onnx_encoder()
+ONNX_MODEL_DIR = 'minilm_int8'
+ONNX_FILE_NAME = 'model_quantized.onnx'
+
+
+class OnnxEncoder:
+    """
+    minimal stand-in for SentenceTransformer backed by an int8 onnx runtime session
+    mean-pools the last hidden state the same way the sentence transformer does
+    and supports the encode() arguments used in this project
+    """
+
+    def __init__(self, model_dir: str = ONNX_MODEL_DIR):
+        """
+        loads the quantized onnx model and its fast tokenizer from model_dir
+        raises ImportError if onnxruntime or transformers isnt installed
+        """
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir, use_fast=True)
+        # cap onnx runtime's intra-op pool like torch's so it honours the app's thread budget
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = int(os.environ.get("OMP_NUM_THREADS", 0))
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, ONNX_FILE_NAME),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        # the export may or may not take token_type_ids so only feed what the graph declares
+        self._input_names = {node.name for node in self.session.get_inputs()}
+        self._hidden_size = self.session.get_outputs()[0].shape[-1]
+        self.max_seq_length = 256
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """returns the embedding size (384 for MiniLM-L6)"""
+        return self._hidden_size
+
+    def encode(self, texts: List[str], batch_size: int = 32, convert_to_numpy: bool = True,
+               normalize_embeddings: bool = False, **kwargs) -> np.ndarray:
+        """
+        encodes texts into mean-pooled float32 embeddings
+        mirrors SentenceTransformer.encode for the arguments we pass
+        """
+        if isinstance(texts, str):
+            texts = [texts]
+        pooled_batches = []
+        for start in range(0, len(texts), batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np',
+            )
+            feed = {name: value.astype('int64') for name, value in inputs.items() if name in self._input_names}
+            hidden = np.asarray(self.session.run(None, feed)[0], dtype='float32')
+            # average only over real tokens, not padding
+            mask = inputs['attention_mask'][..., None].astype('float32')
+            pooled_batches.append((hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+        if pooled_batches:
+            embeddings = np.concatenate(pooled_batches)
+        else:
+            embeddings = np.zeros((0, self.get_sentence_embedding_dimension()), dtype='float32')
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
+
+
+def export_onnx_encoder(output_dir: str = ONNX_MODEL_DIR):
+    """
+    exports MiniLM to onnx and applies onnx runtime dynamic int8 weight quantization
+    run once offline - requires optimum[onnxruntime] for the export step,
+    the app itself only needs onnxruntime and transformers to load the result
+    """
+    import tempfile
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory() as export_dir:
+        ORTModelForFeatureExtraction.from_pretrained(HF_MODEL_ID, export=True).save_pretrained(export_dir)
+        quantize_dynamic(
+            os.path.join(export_dir, "model.onnx"),
+            os.path.join(output_dir, ONNX_FILE_NAME),
+            weight_type=QuantType.QInt8,
+        )
+    AutoTokenizer.from_pretrained(HF_MODEL_ID).save_pretrained(output_dir)
+
+
+def load_encoder() -> Any:
+    """
+    loads the text encoder used for both corpus and query embeddings
+    prefers the int8 onnx export when ONNX_MODEL_DIR exists and onnxruntime is installed,
+    otherwise falls back to the pytorch sentence transformer
+    on a cuda host the pytorch model on the gpu beats the int8 cpu export, so it is used instead
+    """
+    if os.path.isdir(ONNX_MODEL_DIR) and get_device() == 'cpu':
+        try:
+            return OnnxEncoder(ONNX_MODEL_DIR)
+        except ImportError:
+            pass  # fall through to the pytorch model
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(MODEL_NAME, device=get_device())
+
+
+def use_faiss_threads() -> None:
+    """
+    applies the faiss thread budget from FAISS_NUM_THREADS to the calling thread
+    openmp thread counts are per thread, so every thread that searches an index
+    (each streamlit script thread, executor workers) calls this right before searching
+    leaves the OMP_NUM_THREADS default alone when the variable isnt set
+    """
+    threads = os.environ.get("FAISS_NUM_THREADS")
+    if threads:
+        import faiss
+        faiss.omp_set_num_threads(int(threads))
+
+
+def get_device() -> str:
+    """
+    returns 'cuda' when torch can see a gpu, otherwise 'cpu'
+    """
+    try:
+        import torch
+    except ImportError:
+        return 'cpu'
+    return 'cuda' if torch.cuda.is_available() else 'cpu'
+
+
+def encode_many(model: Any, texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """
+    encodes a list of texts into unit-length float32 embeddings
+    sorts the inputs by token count first so each batch pads to a similar length,
+    then puts the rows back in the original order
+
+    takes the sentence transformer model and the texts to encode
+    returns a (len(texts), dim) float32 array
+    """
+    if len(texts) <= 1:
+        # nothing to reorder for the interactive single-query path
+        embeddings = model.encode(texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True)
+        return np.asarray(embeddings, dtype='float32')
+
+    # one batched call to the fast (rust) tokenizer instead of a python loop of tokenize() calls
+    token_ids = model.tokenizer(texts, add_special_tokens=False, truncation=False)['input_ids']
+    lengths = [len(ids) for ids in token_ids]
+    order = np.argsort(lengths, kind='stable')
+    sorted_embeddings = model.encode(
+        [texts[i] for i in order],
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    embeddings = np.empty(sorted_embeddings.shape, dtype='float32')
+    embeddings[order] = sorted_embeddings
+    return embeddings
+
+
+def normalize_query(query: str) -> str:
+    """
+    canonical form of a query for embedding caches
+    lowercases and collapses whitespace - neither changes the uncased MiniLM embedding
+    """
+    return " ".join(query.lower().split())
+
+
+def encode_queries(model: Any, queries: List[str]) -> np.ndarray:
+    """
+    encodes search queries the same way as encode_many but caps each one at
+    QUERY_MAX_SEQ_LENGTH tokens instead of the model's 256 token limit
+    the cap is applied to the text so the shared model (and its max_seq_length) is left alone
+
+    takes the encoder and the query strings
+    returns a (len(queries), dim) float32 array
+    """
+    truncated = []
+    for query in queries:
+        tokens = model.tokenizer.tokenize(query)
+        if len(tokens) > QUERY_MAX_SEQ_LENGTH:
+            query = model.tokenizer.convert_tokens_to_string(tokens[:QUERY_MAX_SEQ_LENGTH])
+        truncated.append(query)
+    return encode_many(model, truncated)
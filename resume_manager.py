@@ -8,11 +8,11 @@ import faiss
 import numpy as np
 import json
 import os
-from typing import Dict, List, Optional, Tuple
-from sentence_transformers import SentenceTransformer
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from openai import OpenAI
 from dotenv import load_dotenv
-from resume_processor import ResumeProcessor
+from resume_processor import OPENAI_MAX_RETRIES, ResumeProcessor
+from embedding_utils import encode_many, encode_queries, load_encoder, normalize_query, use_faiss_threads
 
 # load environment variables
 load_dotenv()
@@ -77,30 +77,60 @@ class ResumeManager:
     """
 
     MAX_RESUMES = None  # no limit on number of resumes
+    QUERY_CACHE_SIZE = 256  # how many query embeddings to remember
+    SEARCH_CACHE_SIZE = 128  # how many search results to remember per set of resumes
 
-    def __init__(self):
+    def __init__(self, model=None):
         """
         initializes the manager with embedding model and storage
         sets up faiss index and conversation memory
+        pass an already loaded encoder as model to share it instead of loading another copy
         """
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.model = model if model is not None else load_encoder()
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
-        self.client = OpenAI(api_key=api_key)
+        # the sdk retries rate limits and 5xx errors with exponential backoff
+        self.client = OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
         self.processor = ResumeProcessor()
         
         # storage for all the resumes
-        self.resumes = {}  # resume_id -> {"text": str, "metadata": dict, "chunks": list}
+        self.resumes = {}  # resume_id -> {"text": str, "metadata": dict, "chunks": list, "embeddings": array}
         self.all_chunks = []  # flat list of all chunks for faiss
         self.chunk_to_resume = []  # maps chunk index back to resume_id
         
+        # bumped whenever the set of resumes changes so callers can cache derived data
+        self.version = 0
+        
+        # per-candidate columns in upload order, kept next to self.resumes
+        # so the per-turn prompt code reads flat lists instead of nested dicts
+        self.candidate_names = []
+        self.candidate_roles = []
+        self.candidate_experience = []
+        self.candidate_skills_text = []  # first 4 key skills pre-joined for prompts
+        self.candidate_name_terms = []  # casefolded full name plus name parts longer than 2 chars
+        
         # faiss index gets rebuilt when resumes change
         self.index = None
         self.dimension = 384  # dimension of all-MiniLM-L6-v2 embeddings
         
         # conversation memory for context-aware responses
         self.conversation = ConversationMemory()
+        
+        # query text -> embedding, so repeat searches skip the model forward pass
+        self._query_embeddings = {}
+        
+        # (version, text) of the last candidates overview built for the default prompt
+        self._overview_cache = (None, "")
+        
+        # (version, {(normalized query, k): results}) - emptied as soon as the resumes change
+        self._search_cache = (None, {})
+
+        # (version, list) of the metadata dicts the resume database renders on every rerun
+        self._metadata_cache = (None, [])
+
+        # resume_id -> finished detailed summary, dropped when that resume is removed
+        self._summaries = {}
 
     def _generate_resume_id(self, filename: str) -> str:
         """
@@ -139,43 +169,103 @@ class ResumeManager:
         
         return chunks
 
-    def add_resume(self, file_bytes: bytes, filename: str) -> Tuple[str, Dict]:
+    def _encode_query(self, query: str) -> np.ndarray:
+        """
+        embeds a search query, reusing the cached vector for repeat queries
+        the analyzer searches the same question more than once per turn
+        """
+        query = normalize_query(query)
+        embedding = self._query_embeddings.get(query)
+        if embedding is None:
+            embedding = encode_queries(self.model, [query])
+            # drop the oldest entry once the cache is full
+            if len(self._query_embeddings) >= self.QUERY_CACHE_SIZE:
+                self._query_embeddings.pop(next(iter(self._query_embeddings)))
+            self._query_embeddings[query] = embedding
+        return embedding
+
+    def add_resume(self, file_bytes: bytes, filename: str,
+                   pre_extracted_text: Optional[str] = None) -> Tuple[str, Dict]:
         """
         adds a new resume to the manager
         processes the file, extracts metadata, and rebuilds the search index
         
-        takes the raw file bytes and original filename
+        takes the raw file bytes and original filename, plus the text if it was already extracted
         returns tuple of (resume_id, metadata)
         raises an error if processing fails
         """
         # no limit on number of resumes
         
         # process the resume to get text and metadata
-        text, metadata = self.processor.process_resume(file_bytes, filename)
-        
-        # create a unique id for this resume
-        resume_id = self._generate_resume_id(filename)
-        
-        # chunk the text for better retrieval
-        chunks = self._chunk_text(text)
-        
-        # add the candidate name to each chunk for context
-        enriched_chunks = []
-        for chunk in chunks:
-            enriched = f"[resume: {metadata['candidate_name']}]\n{chunk}"
-            enriched_chunks.append(enriched)
-        
-        # store everything
-        self.resumes[resume_id] = {
-            "text": text,
-            "metadata": metadata,
-            "chunks": enriched_chunks
-        }
+        text, metadata = self.processor.process_resume(file_bytes, filename, pre_extracted_text)
+        return self.add_processed_resume(text, metadata, filename)
+
+    def add_processed_resume(self, text: str, metadata: Dict, filename: str) -> Tuple[str, Dict]:
+        """
+        stores a resume that was already run through processor.process_resume
+        lets callers do the slow extraction and llm calls elsewhere (e.g. in worker threads)
+        and only touch the manager state and index from one thread
         
-        # rebuild the faiss index with the new resume
-        self._rebuild_index()
+        takes the extracted text, metadata dict, and original filename
+        returns tuple of (resume_id, metadata)
+        """
+        return self.add_many([(text, metadata, filename)])[0]
+
+    def add_many(self, processed: List[Tuple[str, Dict, str]]) -> List[Tuple[str, Dict]]:
+        """
+        stores several processed resumes at once
+        all of their new chunks go through the encoder in one sorted batch
+        and are appended to the faiss index in one add call
         
-        return resume_id, metadata
+        takes a list of (text, metadata, filename) tuples from processor.process_resume
+        returns a list of (resume_id, metadata) in the same order
+        """
+        added = []
+        new_chunks = []
+        for text, metadata, filename in processed:
+            # create a unique id for this resume
+            resume_id = self._generate_resume_id(filename)
+            
+            # chunk the text for better retrieval
+            chunks = self._chunk_text(text)
+            
+            # add the candidate name to each chunk for context
+            enriched_chunks = []
+            for chunk in chunks:
+                enriched = f"[resume: {metadata['candidate_name']}]\n{chunk}"
+                enriched_chunks.append(enriched)
+            
+            # store everything (embeddings are filled in below)
+            self.resumes[resume_id] = {
+                "text": text,
+                "metadata": metadata,
+                "chunks": enriched_chunks
+            }
+            added.append((resume_id, metadata))
+            new_chunks.extend(enriched_chunks)
+        
+        # one encode call for every new chunk, then hand each resume its rows
+        if new_chunks:
+            embeddings = encode_many(self.model, new_chunks)
+            start = 0
+            for resume_id, _ in added:
+                end = start + len(self.resumes[resume_id]["chunks"])
+                self.resumes[resume_id]["embeddings"] = embeddings[start:end]
+                start = end
+        
+        # resume ids are unique and the index is append-only, so the new rows just go on the end
+        # instead of re-concatenating every stored embedding into a fresh index
+        if added and self.index is not None:
+            for resume_id, _ in added:
+                self.all_chunks.extend(self.resumes[resume_id]["chunks"])
+                self.chunk_to_resume.extend([resume_id] * len(self.resumes[resume_id]["chunks"]))
+            if new_chunks:
+                self.index.add(np.ascontiguousarray(embeddings))
+            self._rebuild_candidate_columns()
+        elif added:
+            self._rebuild_index()
+        
+        return added
 
     def remove_resume(self, resume_id: str) -> bool:
         """
@@ -186,6 +276,8 @@ class ResumeManager:
             return False
         
         del self.resumes[resume_id]
+        # ids are reused for the same filename, so a later upload must not see this summary
+        self._summaries.pop(resume_id, None)
         self._rebuild_index()
         return True
 
@@ -193,35 +285,59 @@ class ResumeManager:
         """
         rebuilds the faiss index from all stored resumes
         called automatically when resumes are added or removed
+        reuses each resume's stored chunk embeddings so nothing is re-encoded
         """
         self.all_chunks = []
         self.chunk_to_resume = []
+        self._rebuild_candidate_columns()
         
-        # collect all chunks from all resumes
+        # collect all chunks and their embeddings from all resumes
+        chunk_embeddings = []
         for resume_id, data in self.resumes.items():
             for chunk in data["chunks"]:
                 self.all_chunks.append(chunk)
                 self.chunk_to_resume.append(resume_id)
+            if "embeddings" not in data:
+                data["embeddings"] = encode_many(self.model, data["chunks"])
+            chunk_embeddings.append(data["embeddings"])
         
-        # create embeddings and build the index
+        # build an inner-product (cosine) index over the unit-length embeddings
         if self.all_chunks:
-            embeddings = self.model.encode(self.all_chunks)
-            embeddings = np.array(embeddings).astype('float32')
-            
-            self.index = faiss.IndexFlatL2(self.dimension)
-            self.index.add(embeddings)
+            self.index = faiss.IndexFlatIP(self.dimension)
+            self.index.add(np.ascontiguousarray(np.concatenate(chunk_embeddings)))
         else:
             self.index = None
 
+    def _rebuild_candidate_columns(self):
+        """
+        refreshes the per-candidate lists from self.resumes
+        called whenever resumes are added, removed, or cleared
+        """
+        self.version += 1
+        metas = [data["metadata"] for data in self.resumes.values()]
+        self.candidate_names = [meta['candidate_name'] for meta in metas]
+        self.candidate_roles = [meta.get('current_role', 'Unknown role') for meta in metas]
+        self.candidate_experience = [meta.get('experience_years', 'Unknown') for meta in metas]
+        self.candidate_skills_text = [', '.join(meta.get('key_skills', [])[:4]) or 'Not specified' for meta in metas]
+        self.candidate_name_terms = []
+        for name in self.candidate_names:
+            name_cf = name.casefold()
+            parts = tuple(part for part in name_cf.split() if len(part) > 2)
+            self.candidate_name_terms.append((name_cf,) + tuple(p for p in parts if p != name_cf))
+
     def get_all_metadata(self) -> List[Dict]:
         """
         returns metadata for all stored resumes
         useful for displaying the resume database
+        the list is rebuilt only when the resumes change (tracked by self.version),
+        so callers should treat it as read-only
         """
-        return [
-            {**data["metadata"], "resume_id": resume_id}
-            for resume_id, data in self.resumes.items()
-        ]
+        if self._metadata_cache[0] != self.version:
+            self._metadata_cache = (self.version, [
+                {**data["metadata"], "resume_id": resume_id}
+                for resume_id, data in self.resumes.items()
+            ])
+        return self._metadata_cache[1]
 
     def get_resume_metadata(self, resume_id: str) -> Optional[Dict]:
         """
@@ -237,25 +353,39 @@ class ResumeManager:
         searches across all resumes for content relevant to the query
         uses faiss for fast similarity search
         
-        returns list of (resume_id, chunk_text, distance) tuples
+        returns list of (resume_id, chunk_text, score) tuples - higher score means more similar
+        """
+        return self.search_many([query], k)[0]
+
+    def search_many(self, queries: List[str], k: int = 5) -> List[List[Tuple[str, str, float]]]:
+        """
+        runs several searches in one go - all queries are embedded in a single
+        encode call and looked up with one batched index.search, which faiss
+        spreads across its openmp threads
+        
+        returns one list of (resume_id, chunk_text, score) tuples per query
         """
         if not self.index or self.index.ntotal == 0:
-            return []
+            return [[] for _ in queries]
         
-        # embed the query and search
-        query_embedding = self.model.encode([query]).astype('float32')
+        # embed the queries (single queries go through the embedding cache) and search
+        if len(queries) == 1:
+            query_embeddings = self._encode_query(queries[0])
+        else:
+            query_embeddings = encode_queries(self.model, queries)
         k = min(k, self.index.ntotal)
-        distances, indices = self.index.search(query_embedding, k)
+        use_faiss_threads()
+        scores, indices = self.index.search(query_embeddings, k)
         
-        results = []
-        for i, idx in enumerate(indices[0]):
-            if idx < len(self.all_chunks):
-                resume_id = self.chunk_to_resume[idx]
-                chunk = self.all_chunks[idx]
-                distance = float(distances[0][i])
-                results.append((resume_id, chunk, distance))
+        all_results = []
+        for row_scores, row_indices in zip(scores, indices):
+            results = []
+            for score, idx in zip(row_scores, row_indices):
+                if 0 <= idx < len(self.all_chunks):
+                    results.append((self.chunk_to_resume[idx], self.all_chunks[idx], float(score)))
+            all_results.append(results)
         
-        return results
+        return all_results
 
     def search_resumes_with_metadata(self, query: str, k: int = 6) -> List[Dict]:
         """
@@ -267,9 +397,18 @@ class ResumeManager:
         if not self.index or self.index.ntotal == 0:
             return []
         
-        query_embedding = self.model.encode([query]).astype('float32')
+        # recruiters re-ask and rephrase the same questions, so results are reused until the resumes change
+        if self._search_cache[0] != self.version:
+            self._search_cache = (self.version, {})
+        search_cache = self._search_cache[1]
+        cache_key = (normalize_query(query), k)
+        if cache_key in search_cache:
+            return search_cache[cache_key]
+        
+        query_embedding = self._encode_query(query)
         k = min(k, self.index.ntotal)
-        distances, indices = self.index.search(query_embedding, k)
+        use_faiss_threads()
+        scores, indices = self.index.search(query_embedding, k)
         
         results = []
         seen_candidates = set()
@@ -290,7 +429,7 @@ class ResumeManager:
                         'current_role': meta.get('current_role', 'Unknown'),
                         'experience_years': meta.get('experience_years', 0),
                         'key_skills': meta.get('key_skills', [])[:5],
-                        'distance': float(distances[0][i])
+                        'score': float(scores[0][i])
                     }
                     
                     # add candidate header if first chunk from this candidate
@@ -309,9 +448,13 @@ class ResumeManager:
                         'current_role': 'Unknown',
                         'experience_years': 0,
                         'key_skills': [],
-                        'distance': float(distances[0][i])
+                        'score': float(scores[0][i])
                     })
         
+        # drop the oldest entry once the cache is full
+        if len(search_cache) >= self.SEARCH_CACHE_SIZE:
+            search_cache.pop(next(iter(search_cache)))
+        search_cache[cache_key] = results
         return results
 
     def _build_cross_resume_context(self, query: str) -> str:
@@ -320,38 +463,44 @@ class ResumeManager:
         includes an overview of all candidates plus relevant search results
         """
         # get summaries of all candidates
-        all_meta = self.get_all_metadata()
-        
-        candidates_overview = "=== resume database overview ===\n"
-        for meta in all_meta:
-            candidates_overview += f"\n{meta['candidate_name']}\n"
-            candidates_overview += f"   role: {meta['current_role']}\n"
-            candidates_overview += f"   experience: {meta['experience_years']} years\n"
-            candidates_overview += f"   skills: {', '.join(meta['key_skills'][:10])}\n"
-            candidates_overview += f"   industries: {', '.join(meta['industries'][:5])}\n"
+        # pieces are collected in one list and joined once instead of growing a string with +=
+        parts = ["=== resume database overview ===\n"]
+        for data in self.resumes.values():
+            meta = data['metadata']
+            parts.append(
+                f"\n{meta['candidate_name']}\n"
+                f"   role: {meta['current_role']}\n"
+                f"   experience: {meta['experience_years']} years\n"
+                f"   skills: {', '.join(meta['key_skills'][:10])}\n"
+                f"   industries: {', '.join(meta['industries'][:5])}\n"
+            )
         
-        # also do semantic search for specific relevant chunks
-        search_results = self.search_resumes(query, k=6)
+        # expand into one sub-query per candidate so everyone gets their most relevant
+        # section, and run them all as a single batched search
+        resume_ids = list(self.resumes)
+        sub_queries = [f"{self.resumes[rid]['metadata']['candidate_name']}: {query}" for rid in resume_ids]
+        per_candidate_results = self.search_many(sub_queries, k=6)
         
-        relevant_content = "\n=== relevant resume sections ===\n"
-        seen_resumes = set()
-        for resume_id, chunk, distance in search_results:
-            if resume_id not in seen_resumes:
-                relevant_content += f"\n{chunk}\n"
-                seen_resumes.add(resume_id)
+        parts.append("\n=== relevant resume sections ===\n")
+        for resume_id, results in zip(resume_ids, per_candidate_results):
+            best_chunk = next((chunk for rid, chunk, score in results if rid == resume_id), None)
+            if best_chunk:
+                parts.append(f"\n{best_chunk}\n")
         
-        return candidates_overview + relevant_content
+        return "".join(parts)
 
-    def query(self, user_query: str, use_memory: bool = True, system_prompt: str = None) -> str:
+    def query(self, user_query: str, use_memory: bool = True, system_prompt: str = None,
+              stream: bool = False) -> Union[str, Iterator[str]]:
         """
         processes a user query and generates a response using rag
         automatically detects if the query is about multiple resumes
         
         takes the users question and optional custom system prompt
-        returns the generated response
+        returns the generated response, or an iterator of response tokens when stream is true
         """
         if not self.resumes:
-            return "no resumes have been uploaded yet - please upload some resumes first to start querying"
+            message = "no resumes have been uploaded yet - please upload some resumes first to start querying"
+            return iter([message]) if stream else message
         
         # detect if this is asking about multiple candidates
         cross_resume_keywords = [
@@ -366,21 +515,23 @@ class ResumeManager:
                               "his ", "her ", "elaborate", "continue", "and what", "also"]
         is_follow_up = any(kw in user_query.lower() for kw in follow_up_keywords)
         
-        # build the appropriate context with enhanced metadata
-        if is_cross_resume:
-            context = self._build_cross_resume_context(user_query)
-        else:
-            # use enhanced search with metadata for better context
-            search_results = self.search_resumes_with_metadata(user_query, k=6)
-            context = "\n\n".join([r['formatted_text'] for r in search_results])
-        
         # use custom system prompt if provided, otherwise use default
         if system_prompt:
+            # the caller already did its own retrieval for this prompt, so skip searching again
             system_content = system_prompt
         else:
+            # build the appropriate context with enhanced metadata
+            # kept as a list of pieces so the prompt is joined in one pass below
+            if is_cross_resume:
+                context_parts = [self._build_cross_resume_context(user_query)]
+            else:
+                # use enhanced search with metadata for better context
+                search_results = self.search_resumes_with_metadata(user_query, k=6)
+                context_parts = [r['formatted_text'] for r in search_results]
+            
             # build candidates overview for context
             candidates_overview = self._get_candidates_overview()
-            system_content = f"""You are an expert HR assistant helping analyze a collection of resumes.
+            system_header = f"""You are an expert HR assistant helping analyze a collection of resumes.
 
 === CANDIDATES IN DATABASE ===
 {candidates_overview}
@@ -394,12 +545,20 @@ class ResumeManager:
 - If information is not available, clearly state that
 
 === RESUME CONTEXT ===
-{context}"""
+"""
+            # one join builds the whole prompt instead of joining the context and then copying it into an f-string
+            buf = [system_header]
+            for i, part in enumerate(context_parts):
+                if i:
+                    buf.append("\n\n")
+                buf.append(part)
+            system_content = "".join(buf)
         
         # set up the messages for the llm
         messages = [{"role": "system", "content": system_content}]
         
         # add conversation history for context awareness (increased from 4 to 8 for better follow-up)
+        conv_context = []
         if use_memory:
             conv_context = self.conversation.get_context(8)
             for msg in conv_context:
@@ -418,6 +577,9 @@ Please provide a helpful, accurate answer. Always specify which candidate you're
         
         messages.append({"role": "user", "content": user_message})
         
+        if stream:
+            return self._stream_response(user_query, messages)
+        
         # generate the response
         try:
             response = self.client.chat.completions.create(
@@ -436,33 +598,66 @@ Please provide a helpful, accurate answer. Always specify which candidate you're
         except Exception as e:
             return f"error generating response: {str(e)}"
 
+    def _stream_response(self, user_query: str, messages: List[Dict]) -> Iterator[str]:
+        """
+        streaming half of query - yields response tokens as they arrive
+        saves the full answer to conversation memory once the stream finishes
+        """
+        parts = []
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=0.3,
+                stream=True
+            )
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            yield f"error generating response: {str(e)}"
+            return
+        
+        # save to conversation memory for future context
+        self.conversation.add_message("user", user_query)
+        self.conversation.add_message("assistant", "".join(parts))
+
     def _get_candidates_overview(self) -> str:
         """
         creates a quick reference of all candidates for the system prompt
+        reuses the last result until the resumes change (tracked by self.version)
         """
-        if not self.resumes:
-            return "No candidates in database."
+        if self._overview_cache[0] == self.version:
+            return self._overview_cache[1]
         
-        lines = []
-        for resume_id, data in self.resumes.items():
-            meta = data['metadata']
-            skills = ', '.join(meta.get('key_skills', [])[:4]) or 'Not specified'
-            lines.append(
-                f"• {meta['candidate_name']}: {meta.get('current_role', 'Unknown')} | "
-                f"{meta.get('experience_years', 'Unknown')} years | Skills: {skills}"
+        if not self.resumes:
+            overview = "No candidates in database."
+        else:
+            overview = '\n'.join(
+                f"• {name}: {role} | {years} years | Skills: {skills}"
+                for name, role, years, skills in zip(
+                    self.candidate_names, self.candidate_roles, self.candidate_experience, self.candidate_skills_text
+                )
             )
-        return '\n'.join(lines)
+        self._overview_cache = (self.version, overview)
+        return overview
 
-    def summarize_resume(self, resume_id: str) -> str:
+    def summarize_resume(self, resume_id: str, stream: bool = False):
         """
         generates a detailed professional summary for a specific resume
         
-        takes the resume id
-        returns a comprehensive summary string
+        takes the resume id and whether to stream the answer
+        returns a comprehensive summary string, or an iterator of summary tokens when stream is true
+        a finished summary is kept per resume, so asking again returns it without another llm call
         """
         if resume_id not in self.resumes:
             return f"resume with id '{resume_id}' not found"
         
+        if resume_id in self._summaries:
+            summary = self._summaries[resume_id]
+            return iter([summary]) if stream else summary
+        
         data = self.resumes[resume_id]
         metadata = data["metadata"]
         text = data["text"]
@@ -484,22 +679,50 @@ provide a 3-4 paragraph summary covering:
 3. technical skills and competencies
 4. overall assessment and potential fit for technical roles"""
 
+        messages = [
+            {
+                "role": "system",
+                "content": "you are an expert hr professional creating comprehensive candidate summaries"
+            },
+            {"role": "user", "content": prompt}
+        ]
+        
+        if stream:
+            return self._stream_summary(resume_id, messages)
+        
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "you are an expert hr professional creating comprehensive candidate summaries"
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0.3
             )
-            return response.choices[0].message.content
+            summary = response.choices[0].message.content
+            self._summaries[resume_id] = summary
+            return summary
         except Exception as e:
             return f"error generating summary: {str(e)}"
 
+    def _stream_summary(self, resume_id: str, messages: List[Dict]) -> Iterator[str]:
+        """
+        streaming half of summarize_resume - yields summary tokens as they arrive
+        and keeps the full summary once the stream finishes without an error
+        """
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=messages,
+                temperature=0.3,
+                stream=True
+            )
+            parts = []
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+            self._summaries[resume_id] = "".join(parts)
+        except Exception as e:
+            yield f"error generating summary: {str(e)}"
+
     def find_candidates_with_skill(self, skill: str) -> List[Dict]:
         """
         finds all candidates who have a specific skill
@@ -534,6 +757,8 @@ provide a 3-4 paragraph summary covering:
         self.resumes = {}
         self.all_chunks = []
         self.chunk_to_resume = []
+        self._summaries = {}
+        self._rebuild_candidate_columns()
         self.index = None
         self.conversation.clear()
 
@@ -6,14 +6,18 @@ handles validation to ensure only actual resumes are processed
 
 import re
 import io
-from typing import Dict, Optional, Tuple
-from openai import OpenAI
+import asyncio
+from typing import Dict, List, Optional, Tuple
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
 import os
 
 # load env vars so we can access the api key
 load_dotenv()
 
+# retries for rate limits, timeouts, and 5xx errors - the openai sdk backs off exponentially between them
+OPENAI_MAX_RETRIES = 3
+
 
 class ResumeProcessor:
     """
@@ -22,6 +26,8 @@ class ResumeProcessor:
     includes validation to reject non-resume documents
     """
 
+    MAX_CONCURRENT_REQUESTS = 8  # cap on parallel llm calls when validating a batch
+
     def __init__(self):
         """
         sets up the processor with an openai client for metadata generation
@@ -30,7 +36,8 @@ class ResumeProcessor:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.client = OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
 
     def extract_text_from_pdf(self, file_bytes: bytes) -> str:
         """
@@ -118,29 +125,23 @@ class ResumeProcessor:
         else:
             raise ValueError(f"unsupported file type: {filename} - supported types are pdf, docx, txt")
 
-    def validate_is_resume(self, text: str) -> Tuple[bool, str]:
+    def _count_resume_indicators(self, text: str) -> int:
         """
-        checks whether a document is actually a resume or cv
-        acts as a guardrail to reject random documents
-        uses both heuristic checks and llm validation
-        
-        takes the extracted text content
-        returns a tuple of (is_valid, reason) explaining the decision
+        counts how many typical resume keywords show up in the text
+        used as a cheap heuristic before asking the llm
         """
-        # quick check first - resumes usually have certain keywords
         text_lower = text.lower()
         resume_indicators = [
             'experience', 'education', 'skills', 'employment', 'work history',
             'professional', 'resume', 'curriculum vitae', 'cv', 'objective',
             'summary', 'qualifications', 'references', 'certifications'
         ]
-        indicator_count = sum(1 for indicator in resume_indicators if indicator in text_lower)
-        
-        # if almost no indicators found its probably not a resume
-        if indicator_count < 2:
-            return False, "document doesnt appear to be a resume - missing typical sections like experience, education, or skills"
+        return sum(1 for indicator in resume_indicators if indicator in text_lower)
 
-        # use the llm for a more accurate check
+    def _validation_messages(self, text: str) -> List[Dict]:
+        """
+        builds the chat messages that ask the llm whether a document is a resume
+        """
         prompt = f"""analyze this document and determine if it is a resume or cv
 
 document text (first 2500 characters):
@@ -161,41 +162,64 @@ respond with exactly this format:
 IS_RESUME: YES or NO
 REASON: one sentence explanation"""
 
+        return [
+            {
+                "role": "system",
+                "content": "you are a document classifier - determine if documents are resumes or cvs - be strict and only accept actual resumes"
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def _parse_validation_response(self, response_text: str) -> Tuple[bool, str]:
+        """
+        parses the IS_RESUME / REASON lines from the llm classifier output
+        """
+        lines = response_text.strip().split('\n')
+        
+        is_resume = False
+        reason = "could not determine document type"
+        
+        for line in lines:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                key = key.strip().upper()
+                value = value.strip()
+                
+                if key == "IS_RESUME":
+                    is_resume = value.upper() == "YES"
+                elif key == "REASON":
+                    reason = value
+        
+        return is_resume, reason
+
+    def validate_is_resume(self, text: str) -> Tuple[bool, str]:
+        """
+        checks whether a document is actually a resume or cv
+        acts as a guardrail to reject random documents
+        uses both heuristic checks and llm validation
+        
+        takes the extracted text content
+        returns a tuple of (is_valid, reason) explaining the decision
+        """
+        # quick check first - resumes usually have certain keywords
+        indicator_count = self._count_resume_indicators(text)
+        
+        # if almost no indicators found its probably not a resume
+        if indicator_count < 2:
+            return False, "document doesnt appear to be a resume - missing typical sections like experience, education, or skills"
+
+        # use the llm for a more accurate check
         try:
             response = self.client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "you are a document classifier - determine if documents are resumes or cvs - be strict and only accept actual resumes"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=self._validation_messages(text),
                 temperature=0.1,
                 max_tokens=100
             )
-            
-            response_text = response.choices[0].message.content.strip()
-            lines = response_text.split('\n')
-            
-            is_resume = False
-            reason = "could not determine document type"
-            
-            for line in lines:
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip().upper()
-                    value = value.strip()
-                    
-                    if key == "IS_RESUME":
-                        is_resume = value.upper() == "YES"
-                    elif key == "REASON":
-                        reason = value
-            
-            return is_resume, reason
+            return self._parse_validation_response(response.choices[0].message.content)
             
         except Exception as e:
             # if llm fails fall back to the heuristic result
@@ -203,6 +227,51 @@ REASON: one sentence explanation"""
                 return True, "validated by heuristic check"
             return False, f"validation failed: {str(e)}"
 
+    async def _validate_is_resume_async(self, client: AsyncOpenAI, text: str,
+                                        semaphore: asyncio.Semaphore) -> Tuple[bool, str]:
+        """
+        async version of validate_is_resume used by validate_many
+        the semaphore throttles how many llm calls are in flight at once
+        """
+        indicator_count = self._count_resume_indicators(text)
+        if indicator_count < 2:
+            return False, "document doesnt appear to be a resume - missing typical sections like experience, education, or skills"
+
+        try:
+            async with semaphore:
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=self._validation_messages(text),
+                    temperature=0.1,
+                    max_tokens=100
+                )
+            return self._parse_validation_response(response.choices[0].message.content)
+        except Exception as e:
+            if indicator_count >= 3:
+                return True, "validated by heuristic check"
+            return False, f"validation failed: {str(e)}"
+
+    def validate_many(self, texts: List[str]) -> List[Tuple[bool, str]]:
+        """
+        validates a batch of documents with concurrent llm calls
+        so n uploads cost roughly one round-trip instead of n
+        
+        takes a list of extracted text contents
+        returns a list of (is_valid, reason) tuples in the same order
+        """
+        if not texts:
+            return []
+
+        async def run_all():
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            # the async client is scoped to this event loop
+            async with AsyncOpenAI(api_key=self.api_key, max_retries=OPENAI_MAX_RETRIES) as client:
+                return await asyncio.gather(
+                    *(self._validate_is_resume_async(client, text, semaphore) for text in texts)
+                )
+
+        return list(asyncio.run(run_all()))
+
     def generate_metadata(self, resume_text: str, filename: str) -> Dict:
         """
         generates structured metadata for a resume using llm analysis
@@ -332,14 +401,19 @@ INDUSTRIES: [industries]"""
 
         return metadata
 
-    def process_resume(self, file_bytes: bytes, filename: str) -> Tuple[str, Dict]:
+    def process_resume(self, file_bytes: bytes, filename: str,
+                       pre_extracted_text: Optional[str] = None) -> Tuple[str, Dict]:
         """
         main method to process a resume file end to end
         extracts the text and then generates all the metadata
         
-        takes the raw file bytes and filename
+        takes the raw file bytes and filename, plus the text if it was already extracted
+        (e.g. for validation) so the file isnt parsed a second time
         returns a tuple of (extracted_text, metadata_dict)
         """
-        text = self.extract_text(file_bytes, filename)
+        text = pre_extracted_text if pre_extracted_text is not None else self.extract_text(file_bytes, filename)
         metadata = self.generate_metadata(text, filename)
+        # display strings for the resume database, joined once here instead of on every render
+        metadata["skills_text"] = ', '.join(metadata["key_skills"][:15]) or 'Not extracted'
+        metadata["industries_text"] = ', '.join(metadata["industries"]) or 'Not extracted'
         return text, metadata
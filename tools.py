@@ -8,18 +8,39 @@ import os
 import json
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
+from embedding_utils import encode_queries, use_faiss_threads
+
 # Injected by init_resources(); used by semantic_search_personal
 _model = None
 _index = None
 _chunks = None
+_chunk_embeddings = None
+_embed_query = None
+
+# Approximate candidates pulled from the index before the exact rerank pass
+RERANK_CANDIDATES = 20
 
 
-def init_resources(model: Any, index: Any, chunks: List[str]) -> None:
-    """Set the FAISS model, index, and chunks for semantic_search_personal."""
-    global _model, _index, _chunks
+def init_resources(
+    model: Any,
+    index: Any,
+    chunks: Any,
+    chunk_embeddings: Any = None,
+    embed_query: Optional[Callable[[str], Any]] = None,
+) -> None:
+    """
+    Set the FAISS model, index, chunks, and exact chunk embeddings for semantic_search_personal.
+    chunks is a list or object array of chunk texts; chunk_embeddings is the matching float16/32 matrix.
+    embed_query optionally replaces model.encode for queries (e.g. a memoized encoder).
+    """
+    global _model, _index, _chunks, _chunk_embeddings, _embed_query
     _model = model
     _index = index
     _chunks = chunks
+    _chunk_embeddings = chunk_embeddings
+    _embed_query = embed_query
 
 
 # --- Tool implementations ---
@@ -30,15 +51,28 @@ def semantic_search_personal(query: str, k: int = 4) -> str:
     Search Roxy's resume and personal data for relevant information.
     Call this with different queries when you need to look up her background, skills, or experience.
     """
-    global _model, _index, _chunks
     if _index is None or _chunks is None or _model is None:
         return "Semantic search is not available (resources not loaded)."
     try:
         k = max(1, min(k, len(_chunks)))
-        query_embedding = _model.encode([query]).astype("float32")
-        distances, indices = _index.search(query_embedding, k)
-        relevant = [_chunks[i] for i in indices[0]]
-        return "\n\n---\n\n".join(relevant)
+        if _embed_query is not None:
+            query_embedding = _embed_query(query)
+        else:
+            query_embedding = encode_queries(_model, [query])
+        # tool calls run on executor workers, which dont inherit the script thread's openmp setting
+        use_faiss_threads()
+        if _chunk_embeddings is None:
+            _, indices = _index.search(query_embedding, k)
+            relevant = [_chunks[i] for i in indices[0] if i >= 0]
+            return "\n\n---\n\n".join(relevant)
+        # Pull extra approximate candidates, then keep the top k by float32 dot product
+        # (embeddings may be stored as float16; only the few candidate rows are upcast)
+        n_candidates = max(k, min(RERANK_CANDIDATES, _index.ntotal))
+        _, indices = _index.search(query_embedding, n_candidates)
+        candidates = indices[0][indices[0] >= 0]
+        scores = _chunk_embeddings[candidates].astype(np.float32) @ query_embedding[0]
+        top = candidates[np.argsort(-scores)[:k]]
+        return "\n\n---\n\n".join(np.take(_chunks, top))
     except Exception as e:
         return f"Search failed: {str(e)}"
 